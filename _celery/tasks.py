@@ -1,31 +1,16 @@
+import logging
 
-# TODO: uncomment this when we have a background task to run
+from app.jobs import JOBS
+from .worker import async_task
 
-# import logging
-# import asyncio
-# from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-# import httpx
+logger = logging.getLogger(__name__)
 
-# from .celery_config import celery
-# from app.core.config import settings
-# from app.models.user.model import UserTokenUpdate
-# from app.models.user.crud import get_users_with_expiring_tokens, update_user_token
 
-# logger = logging.getLogger(__name__)
-
-# @celery.task(bind=True, acks_late=True)
-# def sample_job(self):
-#     """
-#     Main Celery task that runs the token refresh logic using async SQLAlchemy
-#     """
-#     try:
-#         asyncio.run(first_task())
-#     except Exception as e:
-#         logger.error(f"Error in sample_job: {e}")
-
-
-# async def first_task():
-#     """
-#     Async logic to refresh tokens for users with expiring tokens
-#     """
-#     pass
\ No newline at end of file
+@async_task(bind=True, acks_late=True)
+async def run_batch_job(self, job_name: str):
+    """
+    Run (or resume) a registered batch job from app.jobs.
+    """
+    job = JOBS[job_name]()
+    processed = await job.run()
+    logger.info(f"Batch job {job_name} processed {processed} rows")
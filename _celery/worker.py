@@ -0,0 +1,77 @@
+import asyncio
+import functools
+import threading
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from app.core.db import dispose_engines_after_fork, engine, replica_engines
+from .celery_config import celery
+
+# One event loop per worker process, running in its own thread. Tasks submit
+# coroutines to it, so the loop and the engine's pooled asyncpg connections
+# (which are bound to that loop) are reused across jobs. This works for both
+# the prefork and the threads pool.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="celery-asyncio", daemon=True
+            )
+            _loop_thread.start()
+        return _loop
+
+
+def run_async(coro):
+    """Run `coro` on the worker's event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+def async_task(*task_args, **task_kwargs):
+    """
+    Register an async function as a Celery task that runs on the worker's
+    persistent event loop, e.g.
+
+        @async_task(bind=True, acks_late=True)
+        async def my_job(self): ...
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            return run_async(func(*args, **kwargs))
+
+        return celery.task(*task_args, **task_kwargs)(run)
+
+    return decorator
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    # Drop any pooled connections (primary and replicas) inherited from the
+    # parent before the fork, as gunicorn's post_fork does; the engines open
+    # fresh ones on this process's loop.
+    dispose_engines_after_fork()
+    get_loop()
+
+
+# worker_process_shutdown only fires in prefork children; with the threads
+# or solo pool the loop lives in the main process, closed on worker_shutdown.
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            return
+    run_async(engine.dispose())
+    for replica_engine in replica_engines:
+        run_async(replica_engine.dispose())
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop_thread.join(timeout=5)
+    _loop.close()
@@ -6,6 +6,7 @@ from sqlmodel import select
 
 from app.core.db import engine
 from app.core.config import settings
+from app.core.rate_limit import login_rate_limiter
 from app.models.user.crud import authenticate
 from app.models.user.model import User
 
@@ -25,6 +26,10 @@ class AdminAuth(AuthenticationBackend):
         email = form.get("username").lower()
         password = form.get("password")
 
+        client_ip = request.client.host if request.client else None
+        if not await login_rate_limiter.allow(email=email, ip=client_ip):
+            return False
+
         user = await authenticate(
             session=session, email=email, password=password
         )
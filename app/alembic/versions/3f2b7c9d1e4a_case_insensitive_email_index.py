@@ -0,0 +1,30 @@
+"""case-insensitive email index
+
+Revision ID: 3f2b7c9d1e4a
+Revises: 91839315aa1e
+Create Date: 2026-10-17 09:12:44.118203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2b7c9d1e4a'
+down_revision = '91839315aa1e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backfill: store every email in its normalized form. This fails if two
+    # rows differ only by case, which must be resolved by hand first.
+    op.execute('UPDATE "user" SET email = lower(email) WHERE email <> lower(email)')
+    op.drop_index(op.f('ix_user_email'), table_name='user')
+    op.create_index('ix_user_email_lower', 'user', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade():
+    op.drop_index('ix_user_email_lower', table_name='user')
+    op.create_index(op.f('ix_user_email'), 'user', ['email'], unique=True)
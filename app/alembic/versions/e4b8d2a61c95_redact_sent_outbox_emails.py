@@ -0,0 +1,32 @@
+"""redact sent outbox emails
+
+Revision ID: e4b8d2a61c95
+Revises: c7e9a2f4b810
+Create Date: 2026-10-17 18:22:47.613092
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b8d2a61c95'
+down_revision = 'c7e9a2f4b810'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('email_outbox', 'html_content',
+               existing_type=sqlmodel.sql.sqltypes.AutoString(),
+               nullable=True)
+    # Bodies of delivered/dead emails may hold live password reset links
+    op.execute("UPDATE email_outbox SET html_content = NULL WHERE status <> 'PENDING'")
+
+
+def downgrade():
+    op.execute("UPDATE email_outbox SET html_content = '' WHERE html_content IS NULL")
+    op.alter_column('email_outbox', 'html_content',
+               existing_type=sqlmodel.sql.sqltypes.AutoString(),
+               nullable=False)
@@ -9,8 +9,9 @@ from sqlmodel import select
 
 from app.core import security
 from app.core.config import settings
-from app.core.db import engine
-from app.models.user.model import User, TokenPayload
+from app.core.db import LazySession, ReadSession, RoutingSession, engine, replica_set
+from app.models.user.cache import cache_user, get_cached_user, recently_invalidated
+from app.models.user.model import User
 
 
 # OAuth2 Scheme
@@ -19,10 +20,15 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
-# Dependency for database session
+# Dependency for database session. The session only checks out a pool
+# connection on first use, and each commit hands it back; objects stay
+# loaded after commit since writes use RETURNING instead of refresh.
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(engine) as session:
+    session = LazySession(lambda: AsyncSession(engine, expire_on_commit=False))
+    try:
         yield session
+    finally:
+        await session.release()
 
 
 # Annotated types for dependencies
@@ -30,13 +36,34 @@ SessionDep = Annotated[AsyncSession, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
+# Dependency for a read-only session, served by a replica when one is healthy
+async def get_read_db(session: SessionDep) -> AsyncGenerator[AsyncSession, None]:
+    replica = await replica_set.pick()
+    if replica is None:
+        yield session
+        return
+
+    read_session = ReadSession(
+        lambda: AsyncSession(
+            sync_session_class=RoutingSession,
+            info={"replica": replica, "primary_session": session},
+        )
+    )
+    try:
+        yield read_session
+    finally:
+        await read_session.release()
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+
 # Dependency to fetch the current user
-async def get_current_user(session: SessionDep, token: TokenDep) -> User:
+async def get_current_user(
+    primary_session: SessionDep, read_session: ReadSessionDep, token: TokenDep
+) -> User:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+        token_data = security.decode_access_token(token)
 
     except (InvalidTokenError, ValidationError):
         raise HTTPException(
@@ -44,6 +71,15 @@ async def get_current_user(session: SessionDep, token: TokenDep) -> User:
             detail="Could not validate credentials",
         )
 
+    # The user is returned detached, so handlers can attach it to the
+    # primary SessionDep when they need to write it.
+    user = get_cached_user(token_data.sub)
+    if user:
+        return user
+
+    # Right after this worker changed the user a replica may still hold the
+    # old row, and caching it would pin that for the whole TTL
+    session = primary_session if recently_invalidated(token_data.sub) else read_session
     result = await session.execute(select(User).where(User.id == token_data.sub))
 
     user = result.scalars().first()
@@ -51,6 +87,11 @@ async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    # Hand the connection back before the handler runs; most handlers
+    # need no further reads, and writers start their own transaction.
+    session.expunge(user)
+    await session.release()
+    cache_user(user)
     return user
 
 # Annotated type for the current user
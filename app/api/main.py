@@ -3,11 +3,17 @@ from fastapi import APIRouter
 from app.api.routes.utils import utils
 from app.api.routes.login import login
 from app.api.routes.user import user
-from app.api.routes.sso import main
+from app.services.sso_providers import PROVIDERS
 
 api_router = APIRouter()
 
 api_router.include_router(utils.router)
 api_router.include_router(login.router)
 api_router.include_router(user.router)
-api_router.include_router(main.router)
\ No newline at end of file
+
+# The SSO routes (and the IdP HTTP/JWKS machinery behind them) are only
+# imported when at least one provider is configured
+if PROVIDERS:
+    from app.api.routes.sso import main as sso
+
+    api_router.include_router(sso.router)
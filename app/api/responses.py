@@ -0,0 +1,62 @@
+import hashlib
+from typing import Any
+
+from pydantic_core import to_json
+from sqlmodel import SQLModel
+from starlette.responses import JSONResponse, Response
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's Rust serializer instead of the
+    standard json module. Accepts plain JSON-able data as well as pydantic
+    models, which are serialized directly without an intermediate dict.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_response(
+    schema: type[SQLModel], obj: Any, status_code: int = 200, headers: dict[str, str] | None = None
+) -> FastJSONResponse:
+    """
+    Build a response straight from an ORM object's attributes through
+    `schema`, skipping FastAPI's response_model validation and
+    jsonable_encoder pass. Declare the same schema as the route's
+    response_model so the OpenAPI document stays accurate.
+    """
+    return FastJSONResponse(schema.model_validate(obj), status_code=status_code, headers=headers)
+
+
+def entity_etag(obj: Any) -> str:
+    """
+    Strong ETag for a row that carries id/created_at/updated_at columns.
+    updated_at is bumped on every UPDATE, so the tag changes whenever the
+    representation can; rows never updated fall back to created_at.
+    """
+    version = obj.updated_at or obj.created_at
+    digest = hashlib.sha256(f"{obj.id}:{version.isoformat()}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(header: str | None, etag: str, weak: bool = False) -> bool:
+    """
+    Check an If-Match / If-None-Match header value against `etag`.
+    If-None-Match uses weak comparison (RFC 9110 13.1.2), If-Match strong.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if weak and candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
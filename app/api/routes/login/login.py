@@ -1,14 +1,16 @@
 from datetime import timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.models.user import crud
 from app.api.deps import SessionDep
 from app.core import security
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.rate_limit import login_rate_limiter
+from app.core.security import hash_password_async
+from app.models.user.cache import invalidate_user
 from app.models.user.model import Message, NewPassword, Token
 from app.utils import (
     generate_password_reset_token,
@@ -21,13 +23,24 @@ router = APIRouter(tags=["login"])
 
 @router.post("/login/access-token")
 async def login_access_token(
-    session: SessionDep, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+    request: Request,
+    session: SessionDep,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Token:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
+    email = form_data.username.lower()
+    client_ip = request.client.host if request.client else None
+    if not await login_rate_limiter.allow(email=email, ip=client_ip):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS)},
+        )
+
     user = await crud.authenticate(
-        session=session, email=form_data.username.lower(), password=form_data.password
+        session=session, email=email, password=form_data.password
     )
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
@@ -53,8 +66,9 @@ async def recover_password(email: str, session: SessionDep) -> Message:
         )
     password_reset_token = await generate_password_reset_token(email=email)
     await generate_reset_password_email(
-        email_to=user.email, token=password_reset_token, name=user.name
+        session=session, email_to=user.email, token=password_reset_token, name=user.first_name
     )
+    await session.commit()
     return Message(message="Password recovery email sent")
 
 
@@ -76,9 +90,11 @@ async def reset_password(session: SessionDep, body: NewPassword) -> Message:
     elif user.status != user.status.ACTIVE:
         raise HTTPException(status_code=400, detail="Inactive user")
     
-    hashed_password = get_password_hash(password=body.new_password)
+    hashed_password = await hash_password_async(body.new_password)
     user.hashed_password = hashed_password
     
+    user_id = user.id
     session.add(user)
     await session.commit()
+    invalidate_user(user_id)
     return Message(message="Password updated successfully")
@@ -1,13 +1,169 @@
-from fastapi import APIRouter
+from datetime import datetime, timedelta, timezone
+import hashlib
+import logging
+import secrets
+from urllib.parse import urlencode, urlsplit
 
-from .okta import router as okta_router
-from .google import router as google_router
-from .linkedin import router as linkedin_router
-from .microsoft import router as microsoft_router
+import jwt
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import RedirectResponse
+from jwt.exceptions import InvalidTokenError
+
+from app.api.deps import SessionDep
+from app.core import security
+from app.core.config import settings
+from app.models.user.crud import get_or_create_user
+from app.models.user.model import UserSSORegister
+from app.services.sso_http import exchange_code, get_oidc_metadata, get_profile
+from app.services.sso_providers import PROVIDERS, OIDCProvider
 
 router = APIRouter(prefix="/sso", tags=["sso"])
 
-router.include_router(okta_router)
-router.include_router(google_router)
-router.include_router(linkedin_router)
-router.include_router(microsoft_router)
\ No newline at end of file
+
+def get_provider(provider: str) -> OIDCProvider:
+    sso_provider = PROVIDERS.get(provider)
+    if not sso_provider:
+        raise HTTPException(status_code=404, detail="SSO provider not found")
+    return sso_provider
+
+
+# The login's nonce lives in an HttpOnly cookie on the browser that started
+# it; the signed state carries only its hash, so a state (or id_token) from
+# somebody else's login cannot be replayed into this browser's callback.
+NONCE_COOKIE = "sso_nonce"
+LOGIN_TIMEOUT = timedelta(minutes=10)
+
+
+def _hash_nonce(nonce: str) -> str:
+    return hashlib.sha256(nonce.encode()).hexdigest()
+
+
+def encode_state(state_data: dict) -> str:
+    payload = {**state_data, "exp": datetime.now(timezone.utc) + LOGIN_TIMEOUT}
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=security.ALGORITHM)
+
+
+def decode_state(state: str) -> dict:
+    try:
+        state_data = jwt.decode(state, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+        state_data["next"], state_data["nonce_hash"]
+    except (InvalidTokenError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid state parameter")
+    return state_data
+
+
+def get_login_nonce(request: Request, state_data: dict) -> str:
+    nonce = request.cookies.get(NONCE_COOKIE)
+    if not nonce or not secrets.compare_digest(_hash_nonce(nonce), state_data["nonce_hash"]):
+        raise HTTPException(status_code=400, detail="SSO login was not started from this browser")
+    return nonce
+
+
+def safe_next_url(next: str | None) -> str:
+    """
+    Where to send the browser, with its access token, after the login.
+
+    Only paths on the frontend and absolute URLs on one of the allowed
+    origins are accepted; anything else falls back to FRONTEND_URL, so a
+    crafted login link can't hand the token to another site.
+    """
+    frontend_url = settings.FRONTEND_URL.rstrip("/")
+    if not next or "\\" in next or any(ord(char) < 0x20 for char in next):
+        return frontend_url
+    if next.startswith("/") and not next.startswith("//"):
+        return f"{frontend_url}{next}"
+
+    parts = urlsplit(next)
+    origin = f"{parts.scheme}://{parts.netloc}".lower()
+    allowed = {allowed_origin.rstrip("/").lower() for allowed_origin in settings.all_cors_origins}
+    if parts.scheme in ("http", "https") and origin in allowed:
+        return next
+    return frontend_url
+
+
+def _cookie_path(provider: str) -> str:
+    return f"{settings.API_PREFIX}/sso/{provider}"
+
+
+@router.get("/{provider}/login")
+async def sso_login(provider: str, next: str | None = None):
+    sso_provider = get_provider(provider)
+
+    # The nonce must come back in the id_token and in this browser's cookie
+    nonce = secrets.token_urlsafe(32)
+    state_data = {"next": safe_next_url(next), "nonce_hash": _hash_nonce(nonce)}
+    metadata = await get_oidc_metadata(sso_provider.name, sso_provider.discovery_url)
+
+    query = urlencode({
+        "response_type": "code",
+        "client_id": sso_provider.client_id,
+        "redirect_uri": sso_provider.redirect_uri,
+        "scope": " ".join(sso_provider.scopes),
+        "state": encode_state(state_data),
+        "nonce": nonce,
+    })
+    response = RedirectResponse(url=f"{metadata['authorization_endpoint']}?{query}")
+    # SameSite=Lax still sends it on the IdP's top-level redirect back to us
+    response.set_cookie(
+        NONCE_COOKIE,
+        nonce,
+        max_age=int(LOGIN_TIMEOUT.total_seconds()),
+        path=_cookie_path(sso_provider.name),
+        secure=settings.SERVER_URL.startswith("https"),
+        httponly=True,
+        samesite="lax",
+    )
+    return response
+
+
+@router.get("/{provider}/callback")
+async def sso_callback(provider: str, request: Request, session: SessionDep, code: str, state: str):
+    sso_provider = get_provider(provider)
+    state_data = decode_state(state)
+    nonce = get_login_nonce(request, state_data)
+    next_url = state_data["next"]
+    separator = "&" if "?" in next_url else "?"
+
+    try:
+        metadata = await get_oidc_metadata(sso_provider.name, sso_provider.discovery_url)
+        token_data = await exchange_code(
+            sso_provider.name,
+            metadata["token_endpoint"],
+            code=code,
+            redirect_uri=sso_provider.redirect_uri,
+            client_id=sso_provider.client_id,
+            client_secret=sso_provider.client_secret,
+        )
+
+        if not token_data.get("access_token"):
+            raise HTTPException(status_code=400, detail="Failed to obtain access token")
+
+        profile_data = await get_profile(
+            sso_provider.name,
+            token_data,
+            metadata=metadata,
+            client_id=sso_provider.client_id,
+            required_claims=sso_provider.profile_claims,
+            nonce=nonce,
+        )
+
+        if sso_provider.require_verified_email and not profile_data.get(sso_provider.verified_email_claim):
+            raise HTTPException(status_code=401, detail=f"Email is not verified with {sso_provider.display_name}")
+
+        email = profile_data.get(sso_provider.email_claim)
+        first_name = (profile_data.get(sso_provider.first_name_claim) or "").strip()
+        last_name = (profile_data.get(sso_provider.last_name_claim) or "").strip()
+
+        if not email:
+            raise HTTPException(status_code=400, detail=f"Email attribute is missing in the {sso_provider.display_name} response")
+
+        user = await get_or_create_user(session=session, user_register=UserSSORegister(email=email, first_name=first_name, last_name=last_name))
+
+        response = RedirectResponse(url=f"{next_url}{separator}token={security.create_access_token(user.id, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))}")
+        response.delete_cookie(NONCE_COOKIE, path=_cookie_path(sso_provider.name))
+
+        return response
+
+    except Exception as e:
+        logging.error(f"Error in handling {sso_provider.display_name} SSO", exc_info=e)
+        return RedirectResponse(url=settings.FRONTEND_URL)
@@ -1,17 +1,20 @@
 import logging
 import uuid
-from typing import Any
+from typing import Annotated, Any
 from fastapi import HTTPException
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy import select
 
 from app.models.user import crud    
+from app.api.responses import entity_etag, etag_matches, model_response, not_modified
 from app.api.deps import (
     CurrentUser,
+    ReadSessionDep,
     SessionDep
 )
-from app.core.security import get_password_hash, verify_password
+from app.models.user.cache import invalidate_user
+from app.core.security import hash_password_async, verify_password_async
 from app.models.user.model import (
     Message,
     UpdatePassword,
@@ -25,6 +28,21 @@ from app.utils import generate_user_created_email
 
 router = APIRouter(prefix="/users", tags=["user"])
 
+IfNoneMatch = Annotated[str | None, Header()]
+IfMatch = Annotated[str | None, Header()]
+
+
+def check_if_match(if_match: str | None, user: User) -> bool:
+    """
+    Raise 412 when an If-Match header does not match the user's current
+    ETag. Returns whether the update should be version-checked in the DB.
+    """
+    if if_match is None:
+        return False
+    if not etag_matches(if_match, entity_etag(user)):
+        raise HTTPException(status_code=412, detail="User has been modified")
+    return True
+
 
 @router.post("/signup", response_model=UserPublic)
 async def register_user(session: SessionDep, user_in: UserRegister) -> Any:
@@ -40,52 +58,71 @@ async def register_user(session: SessionDep, user_in: UserRegister) -> Any:
         )
     
     user_register = UserRegister.model_validate(user_in)
-    user = await crud.register_user(session=session, user_register=user_register)
-
-    try:
-        await generate_user_created_email(
-            email_to=user_in.email, 
-            name=user_in.first_name, 
-        )
 
-    except Exception as e:
-        logging.error(f"Failed to send welcome email: {str(e)}")
+    # Queued in the outbox and committed together with the new user
+    await generate_user_created_email(
+        session=session,
+        email_to=user_in.email, 
+        name=user_in.first_name, 
+    )
+    user = await crud.register_user(session=session, user_register=user_register)
 
+    return model_response(UserPublic, user)
 
 
 @router.get("/me", response_model=UserPublic)
 async def read_user_me(
-    current_user: CurrentUser
+    session: ReadSessionDep, current_user: CurrentUser, if_none_match: IfNoneMatch = None
 ) -> Any:
     """
     Get current user.
+
+    Plain requests are served from the per-worker user cache and may be up
+    to USER_CACHE_TTL_SECONDS stale. Conditional requests re-read the row,
+    so a 304 is only as stale as the replica (DB_REPLICA_MAX_LAG_SECONDS).
     """
-    return current_user
+    user = current_user
+    if if_none_match is not None:
+        user = await crud.get_user_by_id(session=session, id=current_user.id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+    etag = entity_etag(user)
+    if etag_matches(if_none_match, etag, weak=True):
+        return not_modified(etag)
+    return model_response(UserPublic, user, headers={"ETag": etag})
 
 
 @router.patch("/me", response_model=UserPublic)
 async def update_user_me(
-    *, session: SessionDep, user_in: UserUpdate, current_user: CurrentUser
+    *, session: SessionDep, user_in: UserUpdate, current_user: CurrentUser,
+    if_match: IfMatch = None
 ) -> Any:
     """
     Update own user.
     """
-    if user_in.email:
+    db_user = current_user
+    if if_match is not None:
+        # current_user may be a cached or replica snapshot; the version check
+        # must run against the row as it is on the primary
+        db_user = await crud.get_user_by_id(session=session, id=current_user.id)
+        if not db_user:
+            raise HTTPException(status_code=404, detail="User not found")
+    check_version = check_if_match(if_match, db_user)
+    # UserUpdate always carries the email; only a change needs the uniqueness check
+    if user_in.email and crud.normalize_email(user_in.email) != crud.normalize_email(db_user.email):
         existing_user = await crud.get_user_by_email(session=session, email=user_in.email.lower())
         if existing_user and existing_user.id != current_user.id:
             raise HTTPException(
                 status_code=409, detail="User with this email already exists"
             )
         
-    existing_user = current_user.model_dump(exclude={"password"})
-    user_data = user_in.model_dump(exclude_unset=True)
-    
-    await crud.update_user(session=session, db_user=current_user, user_in=user_in)
-    session.add(current_user)
-    await session.commit()
-    await session.refresh(current_user)
-
-    return current_user
+    user = await crud.update_user(
+        session=session, db_user=db_user, user_in=user_in, check_version=check_version
+    )
+    if not user:
+        raise HTTPException(status_code=412, detail="User has been modified")
+    return model_response(UserPublic, user, headers={"ETag": entity_etag(user)})
 
 
 @router.delete("/me", response_model=Message)
@@ -93,8 +130,10 @@ async def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
     """
     Delete own user.
     """
+    user_id = current_user.id
     await session.delete(current_user)
     await session.commit()
+    invalidate_user(user_id)
     return Message(message="User deleted successfully")
 
 
@@ -106,22 +145,25 @@ async def update_password_me(
     """
     Update own password.
     """
-    if not verify_password(body.current_password, current_user.hashed_password):
+    current_user_id = current_user.id
+    if not await verify_password_async(body.current_password, current_user.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect password")
     if body.current_password == body.new_password:
         raise HTTPException(
             status_code=400, detail="New password cannot be the same as the current one"
         )
-    hashed_password = get_password_hash(body.new_password)
+    hashed_password = await hash_password_async(body.new_password)
     current_user.hashed_password = hashed_password
     session.add(current_user)
     await session.commit()
+    invalidate_user(current_user_id)
     return Message(message="Password updated successfully")
 
 
 @router.get("/{user_id}", response_model=UserPublic)
 async def read_user_by_id(
-    user_id: uuid.UUID, session: SessionDep, current_user: CurrentUser
+    user_id: uuid.UUID, session: ReadSessionDep, current_user: CurrentUser,
+    if_none_match: IfNoneMatch = None
 ) -> Any:
     """
     Get a specific user by id.
@@ -131,10 +173,10 @@ async def read_user_by_id(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if user == current_user:
-        return user
-
-    return user
+    etag = entity_etag(user)
+    if etag_matches(if_none_match, etag, weak=True):
+        return not_modified(etag)
+    return model_response(UserPublic, user, headers={"ETag": etag})
 
 
 @router.patch(
@@ -142,7 +184,8 @@ async def read_user_by_id(
     response_model=UserPublic,
 )
 async def update_user(
-    *, session: SessionDep, user_id: uuid.UUID, user_in: UserUpdate, current_user: CurrentUser
+    *, session: SessionDep, user_id: uuid.UUID, user_in: UserUpdate, current_user: CurrentUser,
+    if_match: IfMatch = None
 ) -> Any:
     """
     Update a user.
@@ -155,16 +198,20 @@ async def update_user(
             status_code=404,
             detail="The user with this id does not exist in the system",
         )
-    if user_in.email:
+    check_version = check_if_match(if_match, db_user)
+    if user_in.email and crud.normalize_email(user_in.email) != crud.normalize_email(db_user.email):
         existing_user = await crud.get_user_by_email(session=session, email=user_in.email.lower())
         if existing_user and existing_user.id != user_id:
             raise HTTPException(
                 status_code=409, detail="User with this email already exists"
             )
-    db_user = await crud.update_user(session=session, db_user=db_user, user_in=user_in)
-    updated_user = UserPublic(**db_user.model_dump())
+    db_user = await crud.update_user(
+        session=session, db_user=db_user, user_in=user_in, check_version=check_version
+    )
+    if not db_user:
+        raise HTTPException(status_code=412, detail="User has been modified")
 
-    return updated_user
+    return model_response(UserPublic, db_user, headers={"ETag": entity_etag(db_user)})
 
 
 @router.delete("/{user_id}")
@@ -182,11 +229,12 @@ async def delete_user(
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if user == current_user:
+    if user.id == current_user.id:
         raise HTTPException(
             status_code=403, detail="Super users are not allowed to delete themselves"
         )
     await session.delete(user)
     await session.commit()
+    invalidate_user(user_id)
     
     return Message(message="User deleted successfully")
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic.networks import EmailStr
 
 from app.models.user.model import Message
-from app.core.security import get_password_hash
-from app.utils import generate_test_email, send_email
+from app.core.config import settings
+from app.core.metrics import collect
+from app.core.security import hash_password_async
+from app.services.email_service import send_email
+from app.utils import generate_test_email
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
@@ -17,7 +23,7 @@ async def test_email(email_to: EmailStr) -> Message:
     Test emails.
     """
     email_data = await generate_test_email(email_to=email_to)
-    send_email(
+    await send_email(
         email_address=email_to,
         subject=email_data.subject,
         html_template=email_data.html_content
@@ -30,8 +36,23 @@ async def health_check() -> bool:
     return True
 
 
+@router.get("/metrics/", include_in_schema=False)
+async def metrics(authorization: Annotated[str | None, Header()] = None) -> dict:
+    """
+    Process-local pool, cache and breaker stats. Open in "local"; elsewhere
+    it needs `Authorization: Bearer <METRICS_TOKEN>` and is hidden when no
+    token is configured.
+    """
+    if settings.ENVIRONMENT != "local":
+        if not settings.METRICS_TOKEN:
+            raise HTTPException(status_code=404, detail="Not Found")
+        if not secrets.compare_digest(authorization or "", f"Bearer {settings.METRICS_TOKEN}"):
+            raise HTTPException(status_code=403, detail="Could not validate credentials")
+    return collect()
+
+
 @router.post("/generate-password-hash")
 async def generate_password_hash(password:Message) -> str:
     password = password.model_dump()
-    hashed_password = get_password_hash(password=password['message'])
+    hashed_password = await hash_password_async(password['message'])
     return hashed_password
\ No newline at end of file
@@ -0,0 +1,76 @@
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit for {name!r} is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures. While open,
+    calls fail fast until `reset_timeout` has passed; then a single trial call
+    is let through (half-open), and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._trial_in_flight = False
+
+    @property
+    def is_available(self) -> bool:
+        """Whether a call made now would be let through."""
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at >= self.reset_timeout
+        return not (self.state == self.HALF_OPEN and self._trial_in_flight)
+
+    def before_call(self) -> None:
+        if self.state == self.CLOSED:
+            return
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.name)
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def record_cancelled(self) -> None:
+        """
+        The call was abandoned by our side (e.g. the client disconnected),
+        which says nothing about the dependency: free a half-open trial slot
+        without counting a failure or a success.
+        """
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,158 @@
+import asyncio
+import gzip
+from collections import Counter
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import register_collector
+
+try:
+    import brotli
+except ImportError:  # pinned in requirements.txt; gzip only without it
+    brotli = None
+
+_stats: Counter[str] = Counter()
+register_collector("compression", lambda: dict(_stats))
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """
+    Pick the best content coding we support from an Accept-Encoding header,
+    honouring q-values and "*". Brotli wins ties with gzip.
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in ("br", "gzip") if brotli else ("gzip",):
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    # mtime=0 keeps the output deterministic for identical bodies
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    gzip/brotli response compression negotiated from Accept-Encoding.
+
+    Only complete, single-message bodies of at least `minimum_size` bytes
+    are compressed; streaming responses, bodies that already carry a
+    Content-Encoding and excluded content types (images, archives, event
+    streams, ...) pass through untouched. Bodies of `offload_size` bytes or
+    more are compressed in a worker thread so they don't stall the loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        offload_size: int = 256 * 1024,
+        excluded_content_types: list[str] | tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+        self.offload_size = offload_size
+        self.excluded_content_types = tuple(excluded_content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str | None, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Message | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk tells us whether to compress
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            await self._send(message)
+            return
+
+        start_message, self.start_message = self.start_message, None
+        headers = MutableHeaders(raw=start_message["headers"])
+        body = message.get("body", b"")
+
+        if not self._is_compressible(start_message, headers) or message.get("more_body", False):
+            _stats["skipped"] += 1
+            self.passthrough = True
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        if len(body) < self.middleware.minimum_size:
+            _stats["below_minimum"] += 1
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            _stats["identity"] += 1
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        level = self.middleware.levels[self.encoding]
+        if len(body) >= self.middleware.offload_size:
+            _stats["offloaded"] += 1
+            compressed = await asyncio.to_thread(compress, body, self.encoding, level)
+        else:
+            compressed = compress(body, self.encoding, level)
+
+        _stats[f"{self.encoding}_responses"] += 1
+        _stats[f"{self.encoding}_bytes_in"] += len(body)
+        _stats[f"{self.encoding}_bytes_out"] += len(compressed)
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+    def _is_compressible(self, start_message: Message, headers: MutableHeaders) -> bool:
+        if start_message["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(self.middleware.excluded_content_types)
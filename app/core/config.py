@@ -89,6 +89,31 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Async engine connection pool (per gunicorn worker)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: bool = True
+    # Defaults to on only when ENVIRONMENT is "local"
+    DB_ECHO: bool | None = None
+
+    @model_validator(mode="after")
+    def _set_default_db_echo(self) -> Self:
+        if self.DB_ECHO is None:
+            self.DB_ECHO = self.ENVIRONMENT == "local"
+        return self
+
+    # Bearer token required by /utils/metrics/ outside "local"; when unset
+    # the endpoint is hidden there
+    METRICS_TOKEN: str = ""
+
+    # Optional read replicas (postgresql+asyncpg DSNs), used by ReadSessionDep
+    DATABASE_REPLICA_URLS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: int = 10
+
     ACS_SENDER_EMAIL: str | None = None
     ACS_CONNECTION_STRING: str | None = None
 
@@ -105,6 +130,17 @@ class Settings(BaseSettings):
 
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
 
+    # bcrypt process pool
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Per-worker cache of authenticated users
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 30
+
+    # Per-worker cache of verified access tokens
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def emails_enabled(self) -> bool:
@@ -133,16 +169,55 @@ class Settings(BaseSettings):
         return self
     
     REDIS_URL: str = "redis://localhost:6379/0"
+    # Defaults to REDIS_URL
+    CELERY_BROKER_URL: str | None = None
+
+    # Table-wide batch jobs (app.jobs)
+    BATCH_JOB_CHUNK_SIZE: int = 1000
+    # Fraction of wall-clock time a job may keep the database busy
+    BATCH_JOB_TARGET_DB_LOAD: float = 0.5
+
+    # Login throttling, applied before any DB lookup or bcrypt work
+    LOGIN_RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    # Attempts per email from a single client IP
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    # Proxies whose X-Forwarded-For is trusted for the client IP (comma
+    # separated, "*" only when the app is unreachable except via the proxy)
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
 
-    # TODO: uncomment this when we have a background task to run
-    # SERVICE_BUS_SAS_KEY: str = ""
-    # SERVICE_BUS_SAS_POLICY: str = ""
-    # SERVICE_BUS_NAMESPACE: str = ""
-    
 
     EMAIL_LOGIC_APP_URL: str = ""
     EMAIL_LOGIC_APP_KEY: str = ""
 
+    # Shared HTTP client for the email Logic App (per worker)
+    EMAIL_HTTP2: bool = False  # requires the `h2` package
+    EMAIL_HTTP_MAX_CONNECTIONS: int = 20
+    # Defaults to EMAIL_MAX_CONCURRENT_SENDS; any lower and connections are
+    # closed after each send at full concurrency, only to be reopened
+    EMAIL_HTTP_MAX_KEEPALIVE: int | None = None
+    EMAIL_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    EMAIL_HTTP_TIMEOUT: float = 10.0
+    EMAIL_HTTP_CONNECT_TIMEOUT: float = 5.0
+    EMAIL_MAX_CONCURRENT_SENDS: int = 20
+
+    @model_validator(mode="after")
+    def _set_default_email_keepalive(self) -> Self:
+        if self.EMAIL_HTTP_MAX_KEEPALIVE is None:
+            self.EMAIL_HTTP_MAX_KEEPALIVE = self.EMAIL_MAX_CONCURRENT_SENDS
+        return self
+
+    # Transactional email outbox, drained by an in-process dispatcher
+    EMAIL_OUTBOX_DISPATCHER_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL: float = 2.0
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 60
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 5.0
+    # Sent and dead rows are deleted after this long
+    EMAIL_OUTBOX_RETENTION_HOURS: int = 72
+
     SUPPORT_EMAIL: str = ""
 
     # SSO
@@ -160,4 +235,66 @@ class Settings(BaseSettings):
     MICROSOFT_AUTH_CLIENT_SECRET: str = ""
     MICROSOFT_AUTH_TENANT_ID: str = ""
 
+    # Shared HTTP clients for identity providers (per worker)
+    SSO_HTTP_MAX_CONNECTIONS: int = 10
+    SSO_HTTP_MAX_KEEPALIVE: int = 5
+    SSO_HTTP_TIMEOUT: float = 10.0
+    SSO_HTTP_CONNECT_TIMEOUT: float = 5.0
+    # Per-provider overrides of the above, e.g. {"okta": {"max_connections": 20, "timeout": 5}}
+    SSO_HTTP_PROVIDER_OVERRIDES: dict[str, dict[str, float]] = {}
+    SSO_METADATA_TTL_SECONDS: int = 3600
+    # Additional OIDC providers, keyed by name; each value holds the
+    # OIDCProvider fields, e.g. {"auth0": {"display_name": "Auth0",
+    # "client_id": "...", "client_secret": "...", "discovery_url": "..."}}
+    SSO_PROVIDERS: dict[str, dict[str, Any]] = {}
+
+    # Deadlines and circuit breakers for outbound calls; dependency names are
+    # "email" and "sso:<provider>"
+    OUTBOUND_DEFAULT_DEADLINE: float = 15.0
+    OUTBOUND_DEADLINES: dict[str, float] = {}
+    OUTBOUND_BREAKER_FAILURE_THRESHOLD: int = 5
+    OUTBOUND_BREAKER_RESET_SECONDS: float = 30.0
+
+    # Response compression (app.core.compression); brotli (in requirements.txt)
+    # is used when the client accepts it, gzip otherwise
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # Bodies at least this large are compressed in a worker thread
+    COMPRESSION_OFFLOAD_SIZE: int = 256 * 1024
+    # Content types passed through as-is (prefix match)
+    COMPRESSION_EXCLUDED_CONTENT_TYPES: list[str] = [
+        "image/",
+        "video/",
+        "audio/",
+        "font/woff",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/octet-stream",
+        "text/event-stream",
+    ]
+
+    # Gunicorn worker profile (gunicorn.conf.py, app.core.worker_profile)
+    GUNICORN_BIND: str = "0.0.0.0:80"
+    # Fixed worker count; when unset it is derived from the CPUs and memory
+    # available to the container (cgroup limits included)
+    GUNICORN_WORKERS: int | None = None
+    GUNICORN_WORKERS_PER_CPU: float = 1.0
+    GUNICORN_MAX_WORKERS: int = 16
+    # Memory budget per worker, including its password hashing processes
+    GUNICORN_WORKER_MEMORY_MB: int = 384
+    GUNICORN_PRELOAD_APP: bool = True
+    # Recycle workers after this many requests (0 disables), staggered by jitter
+    GUNICORN_MAX_REQUESTS: int = 10000
+    GUNICORN_MAX_REQUESTS_JITTER: int = 1000
+    GUNICORN_KEEPALIVE: int = 5
+    GUNICORN_BACKLOG: int = 2048
+    GUNICORN_TIMEOUT: int = 60
+    GUNICORN_GRACEFUL_TIMEOUT: int = 30
+    # "auto" picks uvloop/httptools when installed
+    UVICORN_LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    UVICORN_HTTP: Literal["auto", "h11", "httptools"] = "auto"
+
 settings = Settings()  # type: ignore
@@ -1,21 +1,284 @@
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlmodel import select
+import asyncio
+import logging
+import time
+from typing import Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
 import uuid
 
 from app.models.user import crud
 from app.core.config import settings
+from app.core.metrics import register_collector
 from app.models.user.model import User, UserRegister
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True, future=True)
+logger = logging.getLogger(__name__)
 
-async def init_db(session: AsyncSession) -> None:
 
-    result = await session.execute(
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that also records how long callers waited for a connection,
+    and separately how long opening new connections took.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.connect_count = 0
+        self.connect_seconds_total = 0.0
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        record._connect_seconds = time.perf_counter() - start
+        self.connect_count += 1
+        self.connect_seconds_total += record._connect_seconds
+        return record
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connect_seconds = 0.0
+        try:
+            record = super()._do_get()
+            # A connection opened for this checkout is connect time, not wait
+            connect_seconds = getattr(record, "_connect_seconds", 0.0)
+            record._connect_seconds = 0.0
+            return record
+        finally:
+            waited = time.perf_counter() - start - connect_seconds
+            self.checkout_count += 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+
+
+def create_engine(url: str):
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+def pool_stats(db_engine) -> dict:
+    pool = db_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkout_count": pool.checkout_count,
+        "checkout_wait_seconds_total": pool.checkout_wait_total,
+        "checkout_wait_seconds_max": pool.checkout_wait_max,
+        "connect_count": pool.connect_count,
+        "connect_seconds_total": pool.connect_seconds_total,
+    }
+
+
+async def warm_up_pool(db_engine, connections: int) -> None:
+    """
+    Open `connections` pooled connections up front so the first requests
+    after startup don't pay for connection setup.
+
+    Best effort: if the database is unreachable the worker still starts,
+    and connects lazily on first use as it would without warm-up.
+    """
+
+    async def _ping() -> None:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
-        select(User).where(User.email.ilike(settings.ADMIN_SUPERUSER))
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(_ping() for _ in range(connections))),
+            timeout=settings.DB_POOL_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed, continuing without it: {e!r}")
+
+
+class Replica:
+    def __init__(self, db_engine: AsyncEngine):
+        self.engine = db_engine
+        self.healthy = True
+        self.checked_at = float("-inf")
+
+
+class ReplicaSet:
+    """
+    Round-robins over read replicas, skipping any that are unreachable or
+    lagging by more than DB_REPLICA_MAX_LAG_SECONDS. Health is re-checked
+    at most once per DB_REPLICA_HEALTH_CHECK_INTERVAL per replica.
+    """
+
+    LAG_QUERY = text(
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
     )
-    user = result.scalars().first()
+
+    def __init__(self, engines: list[AsyncEngine]):
+        self.replicas = [Replica(db_engine) for db_engine in engines]
+        self._next = 0
+
+    async def pick(self) -> AsyncEngine | None:
+        count = len(self.replicas)
+        for offset in range(count):
+            replica = self.replicas[(self._next + offset) % count]
+            if await self._is_healthy(replica):
+                self._next = (self._next + offset + 1) % count
+                return replica.engine
+        return None
+
+    def mark_down(self, db_engine: AsyncEngine) -> None:
+        """Take a replica out of rotation until its next health check."""
+        for replica in self.replicas:
+            if replica.engine is db_engine:
+                replica.healthy = False
+                replica.checked_at = time.monotonic()
+
+    async def _is_healthy(self, replica: Replica) -> bool:
+        now = time.monotonic()
+        if now - replica.checked_at < settings.DB_REPLICA_HEALTH_CHECK_INTERVAL:
+            return replica.healthy
+
+        # Claim the check before awaiting so concurrent requests don't pile
+        # on, and keep the replica out of rotation until it has passed
+        replica.checked_at = now
+        replica.healthy = False
+
+        async def _lag() -> float:
+            async with replica.engine.connect() as conn:
+                return float(await conn.scalar(self.LAG_QUERY) or 0)
+
+        try:
+            lag = await asyncio.wait_for(_lag(), timeout=settings.DB_POOL_TIMEOUT)
+            replica.healthy = lag <= settings.DB_REPLICA_MAX_LAG_SECONDS
+        except Exception:
+            replica.healthy = False
+        return replica.healthy
+
+
+class LazySession:
+    """
+    Stand-in for an AsyncSession that builds the session on first use, so
+    requests that never touch the database never create one.
+
+    `release()` closes the underlying session, returning its connection to
+    the pool; any later use transparently starts a fresh transaction.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        self._factory = factory
+        self._session: AsyncSession | None = None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str):
+        return getattr(self._get_session(), name)
+
+    @property
+    def has_committed(self) -> bool:
+        if self._session is None:
+            return False
+        return self._session.sync_session.info.get("has_committed", False)
+
+    async def release(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+class RoutingSession(Session):
+    """
+    Session for read-only work that runs on the replica chosen for the
+    request, or on the primary once the request's primary session has
+    committed (read-your-writes).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary_session = self.info.get("primary_session")
+        replica = self.info.get("replica")
+        if self._flushing or replica is None or (
+            primary_session is not None and primary_session.has_committed
+        ):
+            return engine.sync_engine
+        return replica.sync_engine
+
+
+class ReadSession(LazySession):
+    """
+    LazySession over a RoutingSession. A read that fails because its
+    replica went away takes the replica out of rotation and is retried
+    once on the primary.
+    """
+
+    async def _read(self, method: str, *args, **kwargs):
+        session = self._get_session()
+        try:
+            return await getattr(session, method)(*args, **kwargs)
+        except (OperationalError, InterfaceError):
+            replica = session.info.get("replica")
+            if replica is None:
+                raise
+            replica_set.mark_down(replica)
+            await session.rollback()
+            session.info["replica"] = None
+            return await getattr(session, method)(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._read("execute", *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await self._read("scalar", *args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await self._read("scalars", *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await self._read("get", *args, **kwargs)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info["has_committed"] = True
+
+
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+register_collector("db_pool", lambda: pool_stats(engine))
+
+replica_engines = [create_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+replica_set = ReplicaSet(replica_engines)
+for index, replica_engine in enumerate(replica_engines):
+    register_collector(f"db_replica_pool_{index}", lambda e=replica_engine: pool_stats(e))
+
+
+def dispose_engines_after_fork() -> None:
+    """
+    Drop pooled connections inherited from a preloading parent process
+    without closing them, so the child opens its own and the parent's
+    sockets are left alone.
+    """
+    engine.sync_engine.dispose(close=False)
+    for replica_engine in replica_engines:
+        replica_engine.sync_engine.dispose(close=False)
+
+
+async def init_db(session: AsyncSession) -> None:
+
+    user = await crud.get_user_by_email(session=session, email=settings.ADMIN_SUPERUSER)
     if not user:
         user_in = UserRegister(
             id=uuid.uuid4(),
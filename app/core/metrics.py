@@ -0,0 +1,13 @@
+from typing import Any, Callable
+
+# Process-local metric sources. Each one returns a flat dict that is
+# published under its name by the /utils/metrics/ endpoint.
+_collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_collector(name: str, collector: Callable[[], dict[str, Any]]) -> None:
+    _collectors[name] = collector
+
+
+def collect() -> dict[str, dict[str, Any]]:
+    return {name: collector() for name, collector in _collectors.items()}
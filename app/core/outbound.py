@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.metrics import register_collector
+
+
+class OutboundDependency:
+    """
+    Guards calls to one external dependency (the email Logic App, an
+    identity provider, ...) with a deadline and a circuit breaker, so a
+    slow or failing dependency fails fast instead of piling up requests
+    that hold DB sessions and pool connections.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.deadline = settings.OUTBOUND_DEADLINES.get(name, settings.OUTBOUND_DEFAULT_DEADLINE)
+        self.breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.OUTBOUND_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.OUTBOUND_BREAKER_RESET_SECONDS,
+        )
+        self.calls = 0
+        self.seconds_total = 0.0
+        self.seconds_max = 0.0
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        is_failure: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Await `func(*args, **kwargs)` within the deadline. Raises
+        CircuitOpenError without calling when the circuit is open. Exceptions
+        (including the deadline's TimeoutError) count as failures, as do
+        results for which `is_failure` returns True. Cancellation of the
+        caller is not held against the dependency.
+        """
+        self.breaker.before_call()
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.deadline)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.record_cancelled()
+            raise
+        finally:
+            self._record_latency(time.perf_counter() - start)
+
+        if is_failure is not None and is_failure(result):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    def _record_latency(self, seconds: float) -> None:
+        self.calls += 1
+        self.seconds_total += seconds
+        self.seconds_max = max(self.seconds_max, seconds)
+
+    def stats(self) -> dict:
+        return {
+            **self.breaker.stats(),
+            "deadline_seconds": self.deadline,
+            "calls": self.calls,
+            "seconds_total": self.seconds_total,
+            "seconds_max": self.seconds_max,
+        }
+
+
+_dependencies: dict[str, OutboundDependency] = {}
+
+
+def get_dependency(name: str) -> OutboundDependency:
+    dependency = _dependencies.get(name)
+    if dependency is None:
+        dependency = _dependencies[name] = OutboundDependency(name)
+    return dependency
+
+
+register_collector(
+    "outbound", lambda: {name: dependency.stats() for name, dependency in _dependencies.items()}
+)
@@ -0,0 +1,98 @@
+import time
+import uuid
+from collections import OrderedDict, deque
+
+from app.core.config import settings
+
+
+class MemoryBackend:
+    """
+    Sliding-window log kept in process memory. Only suitable for a single
+    worker, since every gunicorn worker keeps its own counts.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._hits: OrderedDict[str, deque[float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: int) -> bool:
+        now = time.monotonic()
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = self._hits[key] = deque()
+        self._hits.move_to_end(key)
+
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+        # Rejected attempts are not recorded, so a flood cannot keep the
+        # key locked beyond one window
+        if len(hits) >= limit:
+            return False
+        hits.append(now)
+
+        while len(self._hits) > self.max_keys:
+            self._hits.popitem(last=False)
+
+        return True
+
+
+class RedisBackend:
+    """
+    Sliding-window log stored in a Redis sorted set per key, shared by all
+    workers. Any `redis.asyncio`-compatible client (e.g. fakeredis) works.
+    """
+
+    def __init__(self, client=None):
+        if client is None:
+            from redis import asyncio as aioredis
+
+            client = aioredis.from_url(settings.REDIS_URL)
+        self.client = client
+
+    async def hit(self, key: str, limit: int, window: int) -> bool:
+        now = time.time()
+        redis_key = f"ratelimit:{key}"
+        member = f"{now}:{uuid.uuid4().hex}"
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window)
+            pipe.zadd(redis_key, {member: now})
+            pipe.zcard(redis_key)
+            pipe.expire(redis_key, window)
+            _, _, count, _ = await pipe.execute()
+        if count > limit:
+            # Rejected attempts are not recorded, as in MemoryBackend
+            await self.client.zrem(redis_key, member)
+            return False
+        return True
+
+
+class LoginRateLimiter:
+    def __init__(self, backend):
+        self.backend = backend
+
+    async def allow(self, *, email: str, ip: str | None) -> bool:
+        """
+        Record a login attempt and return False if the client IP, or the
+        email from that IP, has exceeded its limit in the current window.
+
+        The strict per-email limit is keyed on email + IP so that a third
+        party cannot lock a victim out of their account, and an attempt
+        already rejected by the IP limit does not count against it.
+        """
+        window = settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+        if ip and not await self.backend.hit(
+            f"login:ip:{ip}", settings.LOGIN_RATE_LIMIT_PER_IP, window
+        ):
+            return False
+        return await self.backend.hit(
+            f"login:email:{email}:{ip or '-'}", settings.LOGIN_RATE_LIMIT_PER_EMAIL, window
+        )
+
+
+def _create_backend():
+    if settings.LOGIN_RATE_LIMIT_BACKEND == "redis":
+        return RedisBackend()
+    return MemoryBackend()
+
+
+login_rate_limiter = LoginRateLimiter(_create_backend())
@@ -1,10 +1,18 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import register_collector
+from app.models.user.model import TokenPayload
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -12,6 +20,27 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
 
 
+class PasswordHashPoolSaturated(Exception):
+    """Raised when too many hash/verify jobs are already queued on the pool."""
+
+
+# bcrypt is CPU bound and holds the GIL, so it runs in worker processes
+# rather than on the event loop. The pool is created inside each gunicorn
+# worker (start_hash_pool in the lifespan), after the fork. Its processes
+# come from a forkserver: by then the uvicorn worker already runs threads
+# (asyncio.to_thread), and forking a threaded process can deadlock.
+_hash_pool: ProcessPoolExecutor | None = None
+# Jobs submitted to the pool and not yet finished. Decremented from the job
+# future's done-callback, which runs on the pool's management thread.
+_hash_pending = 0
+_hash_pending_lock = threading.Lock()
+
+# Validated payloads of recently seen access tokens, keyed by the raw token.
+# Each entry lives only until the token's own `exp`.
+_token_cache = TTLCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=0)
+register_collector("token_cache", _token_cache.stats)
+
+
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
     to_encode = {"exp": expire, "sub": str(subject)}
@@ -19,9 +48,90 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> TokenPayload:
+    """
+    Verify and decode an access token, reusing the result for repeated tokens.
+
+    Raises InvalidTokenError or ValidationError for bad tokens, which are
+    never cached.
+    """
+    token_data = _token_cache.get(token)
+    if token_data is not None:
+        return token_data
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    token_data = TokenPayload(**payload)
+
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        _token_cache.set(token, token_data, ttl=expires_in)
+    return token_data
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload([__name__])
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS, mp_context=mp_context
+        )
+    return _hash_pool
+
+
+async def start_hash_pool() -> None:
+    """Spawn the pool's processes up front so the first login doesn't pay for it."""
+    loop = asyncio.get_running_loop()
+    pool = _get_hash_pool()
+    await asyncio.gather(
+        *(loop.run_in_executor(pool, int) for _ in range(settings.PASSWORD_HASH_WORKERS))
+    )
+
+
+def _hash_job_done(_future) -> None:
+    global _hash_pending
+    with _hash_pending_lock:
+        _hash_pending -= 1
+
+
+async def _run_in_hash_pool(func, *args):
+    global _hash_pending
+    with _hash_pending_lock:
+        if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHashPoolSaturated()
+        _hash_pending += 1
+
+    try:
+        future = _get_hash_pool().submit(func, *args)
+    except BaseException:
+        _hash_job_done(None)
+        raise
+    # Counted until the job itself finishes, not until this caller stops
+    # waiting: a cancelled request (client gone) leaves a running bcrypt job
+    # in the pool, and it must keep its slot. A job still queued is
+    # cancelled along with the caller and frees its slot right away.
+    future.add_done_callback(_hash_job_done)
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
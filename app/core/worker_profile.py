@@ -0,0 +1,117 @@
+import importlib.util
+import os
+from pathlib import Path
+
+from uvicorn.workers import UvicornWorker
+
+from app.core.config import settings
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+# cgroup v1 reports "no limit" as a huge page-aligned number
+_UNLIMITED_MEMORY = 1 << 60
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit() -> float | None:
+    """CPU quota of the container in cores, or None when unlimited."""
+    cpu_max = _read(CGROUP_ROOT / "cpu.max")  # v2: "<quota> <period>"
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max":
+            try:
+                return int(quota) / int(period)
+            except ValueError:
+                pass
+        return None
+
+    quota = _read(CGROUP_ROOT / "cpu" / "cpu.cfs_quota_us")  # v1
+    period = _read(CGROUP_ROOT / "cpu" / "cpu.cfs_period_us")
+    try:
+        if quota and period and int(quota) > 0:
+            return int(quota) / int(period)
+    except ValueError:
+        pass
+    return None
+
+
+def cgroup_memory_limit() -> int | None:
+    """Memory limit of the container in bytes, or None when unlimited."""
+    for path in (CGROUP_ROOT / "memory.max", CGROUP_ROOT / "memory" / "memory.limit_in_bytes"):
+        value = _read(path)
+        if value is None:
+            continue
+        if value == "max":
+            return None
+        try:
+            limit = int(value)
+        except ValueError:
+            return None
+        return limit if limit < _UNLIMITED_MEMORY else None
+    return None
+
+
+def available_cpus() -> float:
+    if hasattr(os, "sched_getaffinity"):
+        cpus: float = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+    return cpus
+
+
+def worker_count() -> int:
+    """
+    GUNICORN_WORKERS if set, otherwise GUNICORN_WORKERS_PER_CPU per
+    available core, capped by how many GUNICORN_WORKER_MEMORY_MB budgets fit
+    in the memory limit and by GUNICORN_MAX_WORKERS.
+    """
+    if settings.GUNICORN_WORKERS:
+        return settings.GUNICORN_WORKERS
+
+    workers = round(available_cpus() * settings.GUNICORN_WORKERS_PER_CPU)
+    memory_limit = cgroup_memory_limit()
+    if memory_limit is not None and settings.GUNICORN_WORKER_MEMORY_MB > 0:
+        workers = min(workers, memory_limit // (settings.GUNICORN_WORKER_MEMORY_MB * 1024 * 1024))
+    return max(1, min(workers, settings.GUNICORN_MAX_WORKERS))
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def event_loop() -> str:
+    if settings.UVICORN_LOOP != "auto":
+        return settings.UVICORN_LOOP
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    if settings.UVICORN_HTTP != "auto":
+        return settings.UVICORN_HTTP
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def describe() -> str:
+    memory_limit = cgroup_memory_limit()
+    memory = f"{memory_limit // (1024 * 1024)}MiB" if memory_limit else "unlimited"
+    return (
+        f"workers={worker_count()} cpus={available_cpus():g} memory={memory} "
+        f"loop={event_loop()} http={http_protocol()} preload={settings.GUNICORN_PRELOAD_APP}"
+    )
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """
+    UvicornWorker with the event loop and HTTP parser resolved from
+    settings; gunicorn's keepalive, backlog and max_requests carry over.
+    """
+
+    CONFIG_KWARGS = {"loop": event_loop(), "http": http_protocol()}
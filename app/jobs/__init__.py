@@ -0,0 +1,14 @@
+from app.jobs.base import UserBatchJob
+
+# Register batch jobs here, keyed by name; they can be run from the CLI
+# (`python -m app.jobs <name>`) or the `_celery.tasks.run_batch_job` task.
+JOBS: dict[str, type[UserBatchJob]] = {}
+
+
+def register_job(job_class: type[UserBatchJob]) -> type[UserBatchJob]:
+    JOBS[job_class.name] = job_class
+    return job_class
+
+
+# Imported for their @register_job side effect
+from app.jobs import normalize_emails
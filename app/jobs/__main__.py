@@ -0,0 +1,24 @@
+import argparse
+import asyncio
+import logging
+
+from app.jobs import JOBS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a batch job over the user table")
+    parser.add_argument("job", choices=sorted(JOBS))
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--target-db-load", type=float, default=None)
+    args = parser.parse_args()
+
+    job = JOBS[args.job](chunk_size=args.chunk_size, target_db_load=args.target_db_load)
+    processed = asyncio.run(job.run())
+    logger.info(f"Processed {processed} rows")
+
+
+if __name__ == "__main__":
+    main()
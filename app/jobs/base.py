@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy import tuple_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.batch_job import crud
+from app.models.user.model import User
+
+logger = logging.getLogger(__name__)
+
+
+class UserBatchJob:
+    """
+    Base class for maintenance jobs that walk the whole `user` table.
+
+    Rows are visited in (created_at, id) order using keyset pagination, so
+    every chunk is an index range scan no matter how deep into the table
+    the job is. After each chunk the cursor is checkpointed in the same
+    transaction as the chunk's writes, so a restarted job resumes where it
+    stopped. Between chunks the job sleeps long enough that it keeps the
+    database busy for roughly `target_db_load` of the wall-clock time.
+
+    Subclasses set `name` and implement `process_chunk`.
+    """
+
+    name: str
+
+    def __init__(self, chunk_size: int | None = None, target_db_load: float | None = None):
+        self.chunk_size = chunk_size or settings.BATCH_JOB_CHUNK_SIZE
+        self.target_db_load = target_db_load or settings.BATCH_JOB_TARGET_DB_LOAD
+
+    async def process_chunk(self, session: AsyncSession, users: list[User]) -> None:
+        raise NotImplementedError
+
+    async def _fetch_chunk(
+        self, session: AsyncSession, last_created_at: datetime | None, last_id
+    ) -> list[User]:
+        statement = select(User).order_by(User.created_at, User.id).limit(self.chunk_size)
+        if last_created_at is not None:
+            statement = statement.where(
+                tuple_(User.created_at, User.id) > tuple_(last_created_at, last_id)
+            )
+        result = await session.execute(statement)
+        return list(result.scalars().all())
+
+    async def run(self) -> int:
+        """Run (or resume) one full pass over the table; returns rows processed."""
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            checkpoint = await crud.get_checkpoint(session=session, job_name=self.name)
+            if checkpoint and checkpoint.completed_at is None:
+                last_created_at, last_id = checkpoint.last_created_at, checkpoint.last_id
+                processed, started_at = checkpoint.processed, checkpoint.started_at
+                logger.info(f"Resuming batch job {self.name} after {processed} rows")
+            else:
+                last_created_at, last_id = None, None
+                processed, started_at = 0, datetime.utcnow()
+            await session.commit()
+
+            while True:
+                chunk_start = time.monotonic()
+                users = await self._fetch_chunk(session, last_created_at, last_id)
+                if users:
+                    await self.process_chunk(session, users)
+                    last_created_at, last_id = users[-1].created_at, users[-1].id
+                    processed += len(users)
+
+                done = len(users) < self.chunk_size
+                await crud.save_checkpoint(
+                    session=session,
+                    job_name=self.name,
+                    last_created_at=last_created_at,
+                    last_id=last_id,
+                    processed=processed,
+                    started_at=started_at,
+                    completed=done,
+                )
+                await session.commit()
+                session.expunge_all()
+
+                if done:
+                    logger.info(f"Batch job {self.name} finished, {processed} rows")
+                    return processed
+
+                busy = time.monotonic() - chunk_start
+                await asyncio.sleep(busy * (1 - self.target_db_load) / self.target_db_load)
@@ -0,0 +1,27 @@
+from sqlalchemy import func, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.jobs import register_job
+from app.jobs.base import UserBatchJob
+from app.models.user.model import User
+
+
+@register_job
+class NormalizeEmailsJob(UserBatchJob):
+    """
+    Lowercase emails stored before sign-up and SSO normalized them, so the
+    stored value matches what lookups through lower(email) compare against.
+
+    Can't conflict: the unique index is already on lower(email).
+    """
+
+    name = "normalize_emails"
+
+    async def process_chunk(self, session: AsyncSession, users: list[User]) -> None:
+        statement = (
+            update(User)
+            .where(User.id.in_([user.id for user in users]), User.email != func.lower(User.email))
+            .values(email=func.lower(User.email))
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(statement)
@@ -1,15 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
-from .admin import create_admin
 
 from app.api.main import api_router
+from app.api.responses import FastJSONResponse
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.db import engine, replica_engines, warm_up_pool
+from app.core.security import PasswordHashPoolSaturated, shutdown_hash_pool, start_hash_pool
+from app.services.email_outbox import run_dispatcher
+from app.services.email_service import close_email_client, get_email_client
+from app.services.sso_providers import PROVIDERS
+from app.utils import precompile_email_templates
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    precompile_email_templates()
+    await start_hash_pool()
+    get_email_client()
+    if settings.DB_POOL_WARMUP:
+        await warm_up_pool(engine, settings.DB_POOL_SIZE)
+
+    stop_dispatcher = asyncio.Event()
+    dispatcher = None
+    if settings.EMAIL_OUTBOX_DISPATCHER_ENABLED and settings.emails_enabled:
+        dispatcher = asyncio.create_task(run_dispatcher(stop_dispatcher))
+
+    yield
+
+    stop_dispatcher.set()
+    if dispatcher:
+        await dispatcher
+    shutdown_hash_pool()
+    await close_email_client()
+    if PROVIDERS:
+        from app.services.sso_http import close_idp_clients
+
+        await close_idp_clients()
+    await engine.dispose()
+    for replica_engine in replica_engines:
+        await replica_engine.dispose()
+
+
 docs_url = None if settings.ENVIRONMENT == "production" else "/docs"
 redoc_url = None if settings.ENVIRONMENT == "production" else "/redoc"
 
@@ -19,8 +61,13 @@ app = FastAPI(
     docs_url=docs_url,
     redoc_url=redoc_url,
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 if settings.ENABLE_ADMIN_PANEL:
+    # sqladmin (and its WTForms/Jinja stack) is only imported when enabled
+    from app.admin import create_admin
+
     admin = create_admin(app)
 
 if settings.all_cors_origins:
@@ -32,4 +79,33 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+        excluded_content_types=settings.COMPRESSION_EXCLUDED_CONTENT_TYPES,
+    )
+
+
+@app.exception_handler(PasswordHashPoolSaturated)
+async def password_hash_pool_saturated_handler(request: Request, exc: PasswordHashPoolSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please try again shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "A required upstream service is unavailable, please try again shortly"},
+        headers={"Retry-After": str(int(settings.OUTBOUND_BREAKER_RESET_SECONDS))},
+    )
+
+
 app.include_router(api_router, prefix=settings.API_PREFIX)
@@ -2,5 +2,7 @@ from sqlmodel import SQLModel
 
 # Register all Database Models here
 from app.models.user.model import User
+from app.models.email_outbox.model import EmailOutbox
+from app.models.batch_job.model import BatchJobCheckpoint
 
 SQLModel.metadata
\ No newline at end of file
@@ -0,0 +1,45 @@
+from datetime import datetime
+import uuid
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.batch_job.model import BatchJobCheckpoint
+
+
+async def get_checkpoint(*, session: AsyncSession, job_name: str) -> BatchJobCheckpoint | None:
+    statement = select(BatchJobCheckpoint).where(BatchJobCheckpoint.job_name == job_name)
+    result = await session.execute(statement)
+    return result.scalars().first()
+
+
+async def save_checkpoint(
+    *,
+    session: AsyncSession,
+    job_name: str,
+    last_created_at: datetime | None,
+    last_id: uuid.UUID | None,
+    processed: int,
+    started_at: datetime,
+    completed: bool = False,
+) -> None:
+    """
+    Upsert the job's cursor. Not committed here, so the checkpoint lands in
+    the same transaction as the chunk's own writes.
+    """
+    now = datetime.utcnow()
+    values = {
+        "last_created_at": last_created_at,
+        "last_id": last_id,
+        "processed": processed,
+        "started_at": started_at,
+        "updated_at": now,
+        "completed_at": now if completed else None,
+    }
+    statement = (
+        pg_insert(BatchJobCheckpoint)
+        .values(job_name=job_name, **values)
+        .on_conflict_do_update(index_elements=[BatchJobCheckpoint.job_name], set_=values)
+    )
+    await session.execute(statement)
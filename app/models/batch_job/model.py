@@ -0,0 +1,17 @@
+import uuid
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class BatchJobCheckpoint(SQLModel, table=True):
+    __tablename__ = "batch_job_checkpoint"
+
+    job_name: str = Field(primary_key=True, max_length=255)
+    # Keyset cursor: the last (created_at, id) processed in the current pass
+    last_created_at: datetime | None = None
+    last_id: uuid.UUID | None = None
+    processed: int = 0
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: datetime | None = None
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+import uuid
+
+from sqlalchemy import delete, func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.email_outbox.model import EmailOutbox, OutboxStatus
+
+
+def enqueue_email(*, session: AsyncSession, email_to: str, subject: str, html_content: str) -> EmailOutbox:
+    """
+    Stage an email on the session. It is written by the caller's next
+    commit, in the same transaction as the change that triggered it.
+    """
+    db_obj = EmailOutbox(email_to=email_to, subject=subject, html_content=html_content)
+    session.add(db_obj)
+    return db_obj
+
+
+async def claim_due_emails(*, session: AsyncSession, limit: int, lease: timedelta) -> list[EmailOutbox]:
+    """
+    Lease up to `limit` due emails by pushing their next_attempt_at past the
+    lease. SKIP LOCKED lets several dispatchers drain the table concurrently
+    without claiming the same rows.
+    """
+    now = datetime.utcnow()
+    due = (
+        select(EmailOutbox.id)
+        .where(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(due.scalar_subquery()))
+        .values(next_attempt_at=now + lease)
+        .returning(EmailOutbox)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    emails = list(result.scalars().all())
+    await session.commit()
+    return emails
+
+
+async def mark_sent(*, session: AsyncSession, id: uuid.UUID) -> None:
+    statement = (
+        update(EmailOutbox)
+        .where(EmailOutbox.id == id)
+        .values(status=OutboxStatus.SENT, sent_at=datetime.utcnow(), last_error=None, html_content=None)
+    )
+    await session.execute(statement)
+
+
+async def mark_failed(
+    *, session: AsyncSession, email: EmailOutbox, error: str, max_attempts: int, backoff_base: float
+) -> None:
+    attempts = email.attempts + 1
+    values = {"attempts": attempts, "last_error": error[:1000]}
+    if attempts >= max_attempts:
+        values["status"] = OutboxStatus.DEAD
+        values["html_content"] = None
+    else:
+        values["next_attempt_at"] = datetime.utcnow() + timedelta(
+            seconds=backoff_base * 2 ** (attempts - 1)
+        )
+    statement = update(EmailOutbox).where(EmailOutbox.id == email.id).values(**values)
+    await session.execute(statement)
+
+
+async def purge_finished(*, session: AsyncSession, older_than: datetime, batch_size: int = 1000) -> int:
+    """
+    Delete sent and dead-lettered emails finished before `older_than`, in
+    batches so a large backlog doesn't hold long locks. Returns the number
+    of rows deleted.
+    """
+    deleted = 0
+    while True:
+        expired = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status.in_([OutboxStatus.SENT, OutboxStatus.DEAD]),
+                func.coalesce(EmailOutbox.sent_at, EmailOutbox.created_at) < older_than,
+            )
+            .limit(batch_size)
+        )
+        result = await session.execute(
+            delete(EmailOutbox).where(EmailOutbox.id.in_(expired.scalar_subquery()))
+        )
+        await session.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlmodel import Field, SQLModel
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+class EmailOutbox(SQLModel, table=True):
+    __tablename__ = "email_outbox"
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    email_to: str = Field(max_length=255)
+    subject: str = Field(max_length=255)
+    # Cleared once the email is sent or dead-lettered; bodies can carry
+    # live secrets such as password reset links
+    html_content: str | None = None
+    status: OutboxStatus = Field(default=OutboxStatus.PENDING, index=True)
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    last_error: str | None = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: datetime | None = None
@@ -0,0 +1,48 @@
+import uuid
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_collector
+from app.models.user.model import User
+
+# Column snapshots of authenticated users keyed by user id, used by
+# get_current_user to skip the per-request SELECT.
+user_cache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+register_collector("user_cache", user_cache.stats)
+
+# Users invalidated recently by this worker. Until a replica has caught up
+# with the write, a snapshot read from it would pin the pre-write row in
+# the cache for a whole TTL, so these are re-read on the primary.
+_recently_invalidated = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_user(user_id: str | uuid.UUID) -> User | None:
+    """
+    Rebuild a detached User from its cached snapshot, ready to be attached
+    to the request's session with `session.add` without another SELECT.
+    """
+    snapshot = user_cache.get(str(user_id))
+    if snapshot is None:
+        return None
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def cache_user(user: User) -> None:
+    user_cache.set(str(user.id), user.model_dump())
+
+
+def invalidate_user(user_id: str | uuid.UUID) -> None:
+    user_cache.invalidate(str(user_id))
+    _recently_invalidated.set(str(user_id), True)
+
+
+def recently_invalidated(user_id: str | uuid.UUID) -> bool:
+    return _recently_invalidated.get(str(user_id)) is not None
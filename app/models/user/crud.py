@@ -1,44 +1,75 @@
 from typing import Any, Optional
 import uuid
 
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 
-from app.core.security import get_password_hash, verify_password
-from app.models.user.model import  User, UserStatus, UserUpdate, UserRegister
+from app.core.security import hash_password_async, verify_password_async
+from app.models.user.cache import invalidate_user
+from app.models.user.model import  User, UserStatus, UserUpdate, UserRegister, UserSSORegister
 
-from app.utils import apply_updates
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
 
 
 async def register_user(
     *, session: AsyncSession, user_register: UserRegister
 ) -> User:
     db_obj = User.model_validate(
-        user_register, update={"hashed_password": get_password_hash(user_register.password), "status": UserStatus.BASIC}
+        user_register, update={"email": normalize_email(user_register.email), "hashed_password": await hash_password_async(user_register.password), "status": UserStatus.BASIC}
     )
 
-    session.add(db_obj)
+    # INSERT ... RETURNING hands back the final row, so no refresh is needed
+    # updated_at is left out so its column default fires, as on an ORM flush
+    statement = insert(User).values(**db_obj.model_dump(exclude={"updated_at"})).returning(User)
+    result = await session.execute(statement)
+    db_user = result.scalars().one()
     await session.commit()
-    await session.refresh(db_obj)
 
-    return db_obj
+    return db_user
 
 
-async def update_user(*, session: AsyncSession, db_user: User, user_in: UserUpdate) -> Any:
+async def update_user(
+    *, session: AsyncSession, db_user: User, user_in: UserUpdate, check_version: bool = False
+) -> Any:
     user_data = user_in.model_dump(exclude_unset=True)
+    if "email" in user_data:
+        user_data["email"] = normalize_email(user_data["email"])
     if "password" in user_data:
         password = user_data.pop("password")
-        user_data["hashed_password"] = get_password_hash(password)
-        
-    await apply_updates(db_user, user_data)
-    session.add(db_user)
+        user_data["hashed_password"] = await hash_password_async(password)
+    if not user_data:
+        return db_user
+
+    # UPDATE ... RETURNING repopulates db_user in place, so no refresh is needed
+    statement = update(User).where(User.id == db_user.id)
+    if check_version:
+        # Optimistic concurrency: only apply if the row is still at the
+        # version the caller saw; returns None when someone else got there first
+        statement = statement.where(User.updated_at.is_not_distinct_from(db_user.updated_at))
+    statement = (
+        statement
+        .values(**user_data)
+        .returning(User)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    result = await session.execute(statement)
+    updated = result.scalars().first()
+    if updated is None:
+        await session.rollback()
+        return None
+    db_user = updated
     await session.commit()
-    await session.refresh(db_user)
+    invalidate_user(db_user.id)
     return db_user
 
 
 async def get_user_by_email(*, session: AsyncSession, email: str) -> User | None:
-    statement = select(User).where(User.email == email)
+    # Matches the functional ix_user_email_lower index
+    statement = select(User).where(func.lower(User.email) == normalize_email(email))
     result = await session.execute(statement)
     session_user = result.scalars().first()
     return session_user
@@ -53,15 +84,35 @@ async def get_user_by_id(*, session: AsyncSession, id: uuid.UUID) -> User | None
 
 async def authenticate(*, session: AsyncSession, email: str, password: str) -> User | None:
     db_user = await get_user_by_email(session=session, email=email)
-    if not db_user:
+    if not db_user or not db_user.hashed_password:
         return None
-    if not verify_password(password, db_user.hashed_password):
+    if not await verify_password_async(password, db_user.hashed_password):
         return None
     return db_user
 
 
-async def get_or_create_user(*, session: AsyncSession, user_register: UserRegister) -> User:
-    db_user = await get_user_by_email(session=session, email=user_register.email)
-    if not db_user:
-        db_user = await register_user(session=session, user_register=user_register)
-    return db_user
+async def get_or_create_user(*, session: AsyncSession, user_register: UserSSORegister) -> User:
+    """
+    Create a passwordless SSO user, or return the existing one with that email.
+
+    The upsert is a single round trip and cannot race with concurrent
+    callbacks on the unique lower(email) index; only an existing user costs a
+    follow-up SELECT.
+    """
+    db_obj = User.model_validate(
+        user_register, update={"email": normalize_email(user_register.email), "status": UserStatus.BASIC}
+    )
+
+    statement = (
+        pg_insert(User)
+        .values(**db_obj.model_dump(exclude={"updated_at"}))
+        .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+        .returning(User)
+    )
+    result = await session.execute(statement)
+    db_user = result.scalars().first()
+    if db_user:
+        await session.commit()
+        return db_user
+
+    return await get_user_by_email(session=session, email=user_register.email)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index, func
 
 from pydantic import EmailStr
 from sqlmodel import Field, SQLModel
@@ -13,7 +13,7 @@ class UserStatus(str, Enum):
 
 
 class UserBase(SQLModel):
-    email: str = Field(unique=True, index=True, max_length=255)
+    email: str = Field(max_length=255)
     first_name: str | None = Field(default=None, max_length=255)
     last_name: str | None = Field(default=None, max_length=255)
     phone_number: str | None = Field(default=None, max_length=255)
@@ -29,6 +29,11 @@ class User(UserBase, table=True):
         sa_column=Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     )
 
+# Emails are unique case-insensitively; all lookups go through lower(email)
+Index("ix_user_email_lower", func.lower(User.email), unique=True)
+# Keyset pagination order for batch jobs
+Index("ix_user_created_at_id", User.created_at, User.id)
+
 class UserRegister(SQLModel):
     email: EmailStr = Field(max_length=255)
     password: str = Field(min_length=8, max_length=40)
@@ -36,6 +41,12 @@ class UserRegister(SQLModel):
     last_name: str | None = Field(default=None, max_length=255)
     phone_number: str | None = Field(default=None, max_length=255)
 
+# Users created through SSO have no password of their own
+class UserSSORegister(SQLModel):
+    email: EmailStr = Field(max_length=255)
+    first_name: str | None = Field(default=None, max_length=255)
+    last_name: str | None = Field(default=None, max_length=255)
+
 # Public schemas should exclude sensitive fields
 class UserPublic(UserBase):
     id: uuid.UUID
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.outbound import get_dependency
+from app.models.email_outbox import crud
+from app.models.email_outbox.model import EmailOutbox
+from app.services.email_service import send_email
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 3600
+
+
+async def _deliver(email: EmailOutbox) -> str | None:
+    """Send one outbox email, returning an error message on failure."""
+    try:
+        response = await send_email(
+            email_address=email.email_to,
+            html_template=email.html_content,
+            subject=email.subject,
+        )
+    except Exception as e:
+        return repr(e)
+    if response.status_code >= 300:
+        return f"HTTP {response.status_code}: {response.text}"
+    return None
+
+
+async def dispatch_batch() -> int:
+    """
+    Claim and send one batch of due emails, recording the outcome of each.
+    Returns the number of emails claimed.
+    """
+    # Leave rows untouched while the provider's circuit is open, rather than
+    # burning their retry attempts on calls that would fail fast anyway
+    if not get_dependency("email").breaker.is_available:
+        return 0
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        emails = await crud.claim_due_emails(
+            session=session,
+            limit=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            lease=timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS),
+        )
+        if not emails:
+            return 0
+
+        errors = await asyncio.gather(*(_deliver(email) for email in emails))
+
+        for email, error in zip(emails, errors):
+            if error is None:
+                await crud.mark_sent(session=session, id=email.id)
+            else:
+                logger.warning(f"Failed to send outbox email {email.id}: {error}")
+                await crud.mark_failed(
+                    session=session,
+                    email=email,
+                    error=error,
+                    max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+                    backoff_base=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+                )
+        await session.commit()
+        return len(emails)
+
+
+async def purge_finished() -> int:
+    """Delete sent and dead emails older than the retention period."""
+    older_than = datetime.utcnow() - timedelta(hours=settings.EMAIL_OUTBOX_RETENTION_HOURS)
+    async with AsyncSession(engine) as session:
+        return await crud.purge_finished(session=session, older_than=older_than)
+
+
+async def run_dispatcher(stop: asyncio.Event) -> None:
+    """
+    Drain the outbox until `stop` is set. Full batches are followed up
+    immediately; otherwise the dispatcher sleeps for the poll interval.
+    Finished rows past their retention are purged about once an hour.
+    """
+    last_purge = float("-inf")
+    while not stop.is_set():
+        if time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+            last_purge = time.monotonic()
+            try:
+                purged = await purge_finished()
+                if purged:
+                    logger.info(f"Purged {purged} finished outbox emails")
+            except Exception as e:
+                logger.error("Email outbox purge failed", exc_info=e)
+
+        try:
+            claimed = await dispatch_batch()
+        except Exception as e:
+            logger.error("Email outbox dispatch failed", exc_info=e)
+            claimed = 0
+
+        if claimed < settings.EMAIL_OUTBOX_BATCH_SIZE:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.EMAIL_OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
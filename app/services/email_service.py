@@ -1,7 +1,55 @@
+import asyncio
 import logging
-import requests
+from dataclasses import dataclass
+from typing import Any
+
 import httpx
 from app.core.config import settings
+from app.core.outbound import get_dependency
+from app.utils import email_templates, render_email_template_async
+
+logger = logging.getLogger(__name__)
+
+
+# One long-lived client per worker so sends reuse pooled keep-alive
+# connections to the Logic App instead of paying DNS/TCP/TLS each time.
+_client: httpx.AsyncClient | None = None
+_send_slots: asyncio.Semaphore | None = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=settings.EMAIL_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.EMAIL_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.EMAIL_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.EMAIL_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.EMAIL_HTTP_TIMEOUT, connect=settings.EMAIL_HTTP_CONNECT_TIMEOUT
+        ),
+    )
+
+
+def get_email_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+async def close_email_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _get_send_slots() -> asyncio.Semaphore:
+    global _send_slots
+    if _send_slots is None:
+        _send_slots = asyncio.Semaphore(settings.EMAIL_MAX_CONCURRENT_SENDS)
+    return _send_slots
 
 
 async def send_email(email_address, html_template, subject):
@@ -14,7 +62,7 @@ async def send_email(email_address, html_template, subject):
         subject (str): Subject line of the email
         
     Returns:
-        aiohttp.ClientResponse: The response from the API
+        httpx.Response: The response from the API
     """
     url = settings.EMAIL_LOGIC_APP_URL
     
@@ -36,13 +84,85 @@ async def send_email(email_address, html_template, subject):
         "Subject": subject
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, params=params, headers=headers, json=data)
-
-        if response.status_code < 300:
-            print(f"Email sent successfully to {email_address}")
-        else:
-            print(f"Failed to send email. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
-        
-        return response
\ No newline at end of file
+    async with _get_send_slots():
+        response = await get_dependency("email").call(
+            get_email_client().post,
+            url,
+            params=params,
+            headers=headers,
+            json=data,
+            is_failure=lambda response: response.status_code >= 500,
+        )
+
+    if response.status_code < 300:
+        logger.info(f"Email sent successfully to {email_address}")
+    else:
+        logger.warning(
+            f"Failed to send email. Status code: {response.status_code}, response: {response.text}"
+        )
+    
+    return response
+
+
+@dataclass
+class EmailSendResult:
+    email_address: str
+    ok: bool
+    status_code: int | None = None
+    error: str | None = None
+
+
+async def send_many(
+    *,
+    template_name: str,
+    subject: str,
+    recipients: list[tuple[str, dict[str, Any]]],
+    concurrency: int | None = None,
+) -> list[EmailSendResult]:
+    """
+    Send one templated email to many recipients.
+
+    The template is loaded and compiled once and rendered per recipient,
+    off the event loop, with that recipient's context. Sends fan out with at most `concurrency`
+    in flight (on top of the process-wide send limit). The Logic App has no
+    batch endpoint, so each recipient is still one request on the shared
+    pooled client.
+
+    Args:
+        template_name (str): Template in email-templates/build
+        subject (str): Subject line shared by all recipients
+        recipients (list): (email_address, context) pairs
+        concurrency (int): Max sends in flight for this call
+
+    Returns:
+        list[EmailSendResult]: One result per recipient, in input order
+    """
+    # Compiled once up front (a missing template fails before any send);
+    # the renders then hit the environment's cache
+    email_templates.get_template(template_name)
+    slots = asyncio.Semaphore(concurrency or settings.EMAIL_MAX_CONCURRENT_SENDS)
+
+    async def _send_one(email_address: str, context: dict[str, Any]) -> EmailSendResult:
+        async with slots:
+            try:
+                # Rendered in a worker thread so a large batch doesn't hold the loop
+                html_content = await render_email_template_async(
+                    template_name=template_name, context=context
+                )
+                response = await send_email(
+                    email_address=email_address,
+                    html_template=html_content,
+                    subject=subject,
+                )
+            except Exception as e:
+                return EmailSendResult(email_address=email_address, ok=False, error=repr(e))
+        return EmailSendResult(
+            email_address=email_address,
+            ok=response.status_code < 300,
+            status_code=response.status_code,
+            error=None if response.status_code < 300 else response.text,
+        )
+
+    return await asyncio.gather(
+        *(_send_one(email_address, context) for email_address, context in recipients)
+    )
@@ -0,0 +1,193 @@
+from typing import Any
+
+import httpx
+import jwt
+from jwt.exceptions import InvalidTokenError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.outbound import get_dependency
+
+# Signing algorithms accepted for provider id_tokens
+ID_TOKEN_ALGORITHMS = ["RS256", "RS384", "RS512", "ES256", "ES384", "PS256"]
+
+# One pooled client per identity provider, created on first use and closed
+# in the app lifespan, so SSO callbacks reuse keep-alive connections
+# instead of paying a TLS handshake per login.
+_clients: dict[str, httpx.AsyncClient] = {}
+
+# OIDC discovery documents and JWKS, keyed by URL
+_metadata_cache = TTLCache(max_size=64, ttl=settings.SSO_METADATA_TTL_SECONDS)
+
+
+def _provider_option(provider: str, name: str, default: float) -> float:
+    return settings.SSO_HTTP_PROVIDER_OVERRIDES.get(provider, {}).get(name, default)
+
+
+def get_idp_client(provider: str) -> httpx.AsyncClient:
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        client = _clients[provider] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(_provider_option(provider, "max_connections", settings.SSO_HTTP_MAX_CONNECTIONS)),
+                max_keepalive_connections=int(_provider_option(provider, "max_keepalive", settings.SSO_HTTP_MAX_KEEPALIVE)),
+            ),
+            timeout=httpx.Timeout(
+                _provider_option(provider, "timeout", settings.SSO_HTTP_TIMEOUT),
+                connect=_provider_option(provider, "connect_timeout", settings.SSO_HTTP_CONNECT_TIMEOUT),
+            ),
+        )
+    return client
+
+
+async def _request(provider: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request to an identity provider through its outbound guard
+    (deadline + circuit breaker). Errors and 5xx responses count as
+    failures; 4xx (e.g. a bad or reused code) does not.
+    """
+    response = await get_dependency(f"sso:{provider}").call(
+        get_idp_client(provider).request,
+        method,
+        url,
+        is_failure=lambda response: response.status_code >= 500,
+        **kwargs,
+    )
+    response.raise_for_status()
+    return response
+
+
+async def close_idp_clients() -> None:
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
+
+
+async def _get_cached_json(provider: str, url: str) -> dict[str, Any]:
+    document = _metadata_cache.get(url)
+    if document is None:
+        response = await _request(provider, "GET", url)
+        document = response.json()
+        _metadata_cache.set(url, document)
+    return document
+
+
+async def get_oidc_metadata(provider: str, discovery_url: str) -> dict[str, Any]:
+    return await _get_cached_json(provider, discovery_url)
+
+
+async def get_jwks(provider: str, jwks_uri: str, refresh: bool = False) -> dict[str, Any]:
+    if refresh:
+        _metadata_cache.invalidate(jwks_uri)
+    return await _get_cached_json(provider, jwks_uri)
+
+
+async def exchange_code(
+    provider: str,
+    token_endpoint: str,
+    *,
+    code: str,
+    redirect_uri: str,
+    client_id: str,
+    client_secret: str,
+) -> dict[str, Any]:
+    response = await _request(
+        provider,
+        "POST",
+        token_endpoint,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "client_id": client_id,
+            "client_secret": client_secret,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    return response.json()
+
+
+async def fetch_userinfo(provider: str, userinfo_endpoint: str, access_token: str) -> dict[str, Any]:
+    response = await _request(
+        provider, "GET", userinfo_endpoint, headers={"Authorization": f"Bearer {access_token}"}
+    )
+    return response.json()
+
+
+async def _get_signing_key(provider: str, jwks_uri: str, kid: str | None):
+    jwks = await get_jwks(provider, jwks_uri)
+    for refresh in (False, True):
+        if refresh:
+            # Unknown kid: the provider may have rotated keys since we cached them
+            jwks = await get_jwks(provider, jwks_uri, refresh=True)
+        for jwk in jwt.PyJWKSet.from_dict(jwks).keys:
+            if kid is None or jwk.key_id == kid:
+                return jwk.key
+    raise InvalidTokenError(f"No signing key {kid!r} in {provider} JWKS")
+
+
+async def verify_id_token(
+    provider: str,
+    id_token: str,
+    *,
+    metadata: dict[str, Any],
+    client_id: str,
+    nonce: str | None = None,
+) -> dict[str, Any]:
+    """
+    Verify an OIDC id_token locally against the provider's cached JWKS,
+    checking signature, issuer, audience, expiry and (if given) nonce.
+    Raises InvalidTokenError if any check fails.
+    """
+    header = jwt.get_unverified_header(id_token)
+    key = await _get_signing_key(provider, metadata["jwks_uri"], header.get("kid"))
+
+    # Multi-tenant issuers (e.g. Microsoft "common") are templated on the tenant
+    issuer = metadata["issuer"]
+    if "{tenantid}" in issuer:
+        unverified = jwt.decode(id_token, options={"verify_signature": False})
+        issuer = issuer.replace("{tenantid}", str(unverified.get("tid", "")))
+
+    claims = jwt.decode(
+        id_token,
+        key=key,
+        algorithms=ID_TOKEN_ALGORITHMS,
+        audience=client_id,
+        issuer=issuer,
+        options={"require": ["exp", "iat", "iss", "aud"]},
+    )
+    if nonce is not None and claims.get("nonce") != nonce:
+        raise InvalidTokenError("id_token nonce does not match the login request")
+    return claims
+
+
+async def get_profile(
+    provider: str,
+    token_data: dict[str, Any],
+    *,
+    metadata: dict[str, Any],
+    client_id: str,
+    required_claims: tuple[str, ...],
+    nonce: str | None = None,
+) -> dict[str, Any]:
+    """
+    Read the user's profile from the id_token returned by the token
+    endpoint. A token that fails verification (signature, issuer,
+    audience, expiry or nonce) fails the login with InvalidTokenError /
+    PyJWKError. userinfo is only called when there is no id_token, or when
+    the verified token lacks any of `required_claims`; its claims then
+    fill the gaps, and must belong to the same subject.
+    """
+    claims: dict[str, Any] = {}
+    id_token = token_data.get("id_token")
+    if id_token:
+        claims = await verify_id_token(
+            provider, id_token, metadata=metadata, client_id=client_id, nonce=nonce
+        )
+        if all(claims.get(claim) for claim in required_claims):
+            return claims
+
+    userinfo = await fetch_userinfo(provider, metadata["userinfo_endpoint"], token_data["access_token"])
+    if claims and userinfo.get("sub") != claims.get("sub"):
+        raise InvalidTokenError(f"{provider} userinfo subject does not match the id_token")
+    return {**claims, **{name: value for name, value in userinfo.items() if not claims.get(name)}}
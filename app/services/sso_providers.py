@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+
+from app.core.config import settings
+
+
+@dataclass
+class OIDCProvider:
+    """
+    Configuration for one OpenID Connect identity provider. Endpoints come
+    from the provider's discovery document; profile fields are read from
+    the verified id_token, or userinfo when claims are missing.
+    """
+
+    name: str
+    display_name: str
+    client_id: str
+    client_secret: str
+    discovery_url: str
+    scopes: list[str] = field(default_factory=lambda: ["openid", "email", "profile"])
+    email_claim: str = "email"
+    first_name_claim: str = "given_name"
+    last_name_claim: str = "family_name"
+    require_verified_email: bool = False
+    # Claim that must be truthy when require_verified_email is set
+    verified_email_claim: str = "email_verified"
+
+    @property
+    def redirect_uri(self) -> str:
+        return f"{settings.SERVER_URL}{settings.API_PREFIX}/sso/{self.name}/callback"
+
+    @property
+    def profile_claims(self) -> tuple[str, ...]:
+        claims = (self.email_claim, self.first_name_claim, self.last_name_claim)
+        if self.require_verified_email:
+            claims += (self.verified_email_claim,)
+        return claims
+
+
+def _builtin_providers() -> list[OIDCProvider]:
+    # Without a tenant id any Entra tenant can sign in, and tenants can put
+    # arbitrary unverified addresses in `email`; accounts are matched on
+    # email, so multi-tenant logins need Microsoft's domain-owner-verified
+    # flag (the xms_edov optional claim, enabled in the app registration).
+    microsoft_tenant = settings.MICROSOFT_AUTH_TENANT_ID or "common"
+    microsoft_multi_tenant = not settings.MICROSOFT_AUTH_TENANT_ID
+    return [
+        OIDCProvider(
+            name="okta",
+            display_name="Okta",
+            client_id=settings.OKTA_AUTH_CLIENT_ID,
+            client_secret=settings.OKTA_AUTH_CLIENT_SECRET,
+            discovery_url=f"https://{settings.OKTA_BASE_URL}/.well-known/openid-configuration",
+            require_verified_email=True,
+        ),
+        OIDCProvider(
+            name="google",
+            display_name="Google",
+            client_id=settings.GOOGLE_AUTH_CLIENT_ID,
+            client_secret=settings.GOOGLE_AUTH_CLIENT_SECRET,
+            discovery_url="https://accounts.google.com/.well-known/openid-configuration",
+            require_verified_email=True,
+        ),
+        OIDCProvider(
+            name="linkedin",
+            display_name="LinkedIn",
+            client_id=settings.LINKEDIN_AUTH_CLIENT_ID,
+            client_secret=settings.LINKEDIN_AUTH_CLIENT_SECRET,
+            discovery_url="https://www.linkedin.com/oauth/.well-known/openid-configuration",
+            require_verified_email=True,
+        ),
+        OIDCProvider(
+            name="microsoft",
+            display_name="Microsoft",
+            client_id=settings.MICROSOFT_AUTH_CLIENT_ID,
+            client_secret=settings.MICROSOFT_AUTH_CLIENT_SECRET,
+            discovery_url=f"https://login.microsoftonline.com/{microsoft_tenant}/v2.0/.well-known/openid-configuration",
+            require_verified_email=microsoft_multi_tenant,
+            verified_email_claim="xms_edov",
+        ),
+    ]
+
+
+def load_providers() -> dict[str, OIDCProvider]:
+    """
+    Build the registry of configured providers: the built-in ones whose
+    client id is set, plus any defined in settings.SSO_PROVIDERS.
+    """
+    providers = [provider for provider in _builtin_providers() if provider.client_id]
+    providers += [
+        OIDCProvider(name=name, **config) for name, config in settings.SSO_PROVIDERS.items()
+    ]
+    return {provider.name: provider for provider in providers}
+
+
+PROVIDERS = load_providers()
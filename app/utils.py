@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -5,12 +6,13 @@ from pathlib import Path
 from typing import Any
 
 import jwt
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from jwt.exceptions import InvalidTokenError
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
 from app.core.config import settings
-from app.services.email_service import send_email
+from app.models.email_outbox.crud import enqueue_email
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,14 +25,44 @@ class EmailData:
 def format_date(date: datetime) -> str:
     return date.strftime("%B %d, %Y at %I:%M %p")
 
+# Compiled templates are kept in memory by the environment and their
+# bytecode is cached on disk, so a worker restart skips recompilation too.
+email_templates = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "email-templates" / "build"),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=settings.ENVIRONMENT == "local",
+)
+
+
+def _queue_email(session: AsyncSession, *, email_to: str, subject: str, html_content: str) -> None:
+    # Without email settings no dispatcher runs, and queued rows (reset
+    # links included) would sit PENDING in the table forever
+    if not settings.emails_enabled:
+        logger.info(f"Emails are disabled, not queueing '{subject}'")
+        return
+    enqueue_email(session=session, email_to=email_to, subject=subject, html_content=html_content)
+
+
+def precompile_email_templates() -> None:
+    for template_name in email_templates.list_templates(extensions=["html"]):
+        email_templates.get_template(template_name)
+
+
 def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
-    template_str = (
-        Path(__file__).parent / "email-templates" / "build" / template_name
-    ).read_text()
-    html_content = Template(template_str).render(context)
+    html_content = email_templates.get_template(template_name).render(context)
     return html_content
 
 
+async def render_email_template_async(*, template_name: str, context: dict[str, Any]) -> str:
+    """
+    Render in a worker thread, for callers rendering large batches that
+    should not hold the event loop.
+    """
+    return await asyncio.to_thread(
+        render_email_template, template_name=template_name, context=context
+    )
+
+
 async def generate_test_email(email_to: str) -> EmailData:
     project_name = settings.PROJECT_NAME
     subject = f"{project_name} - Test email"
@@ -71,11 +103,12 @@ def null_bearer_token():
     return "Bearer token not found for the user."
 
 
-async def generate_reset_password_email(email_to: str, token: str, name: str) -> EmailData:
+async def generate_reset_password_email(session: AsyncSession, email_to: str, token: str, name: str) -> EmailData:
     """
-    Generate email for password reset.
+    Generate email for password reset and queue it in the outbox.
     
     Args:
+        session: Session whose next commit writes the outbox row
         email_to: Recipient's email address
         token: Password reset token
     """
@@ -95,17 +128,15 @@ async def generate_reset_password_email(email_to: str, token: str, name: str) ->
             "valid_hours": settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS,
         },
     )
-    await send_email(
-        email_address=email_to,
-        subject=subject,
-        html_template=html_content
-    )
+    _queue_email(session, email_to=email_to, subject=subject, html_content=html_content)
+    return EmailData(html_content=html_content, subject=subject)
 
-async def generate_user_created_email(email_to: str, name: str, organization_name: str) -> EmailData:
+async def generate_user_created_email(session: AsyncSession, email_to: str, name: str, organization_name: str | None = None) -> EmailData:
     """
-    Generate welcome email for a newly created user.
+    Generate welcome email for a newly created user and queue it in the outbox.
     
     Args:
+        session: Session whose next commit writes the outbox row
         email_to: Recipient's email address
         name: User's name
         organization_name: Name of the organization
@@ -125,9 +156,6 @@ async def generate_user_created_email(email_to: str, name: str, organization_nam
             "login_url": login_url,
         },
     )
-    await send_email(
-        email_address=email_to,
-        subject=subject,
-        html_template=html_content
-    )
+    _queue_email(session, email_to=email_to, subject=subject, html_content=html_content)
+    return EmailData(html_content=html_content, subject=subject)
     
@@ -1,7 +1,31 @@
+from app.core import worker_profile
+from app.core.config import settings
 
-bind = "0.0.0.0:80"
-workers = 4
-worker_class = "uvicorn.workers.UvicornWorker"
-forwarded_allow_ips = "*"
+bind = settings.GUNICORN_BIND
+workers = worker_profile.worker_count()
+worker_class = "app.core.worker_profile.TunedUvicornWorker"
+# Only the reverse proxy may set the client IP that login throttling keys on
+forwarded_allow_ips = settings.FORWARDED_ALLOW_IPS
+
+# Import the app once in the master and fork it into the workers; each
+# worker then drops the inherited DB pool (see post_fork)
+preload_app = settings.GUNICORN_PRELOAD_APP
+max_requests = settings.GUNICORN_MAX_REQUESTS
+max_requests_jitter = settings.GUNICORN_MAX_REQUESTS_JITTER
+keepalive = settings.GUNICORN_KEEPALIVE
+backlog = settings.GUNICORN_BACKLOG
+timeout = settings.GUNICORN_TIMEOUT
+graceful_timeout = settings.GUNICORN_GRACEFUL_TIMEOUT
 
 raw_env = ["UVICORN_CMD_ARGS=--proxy-headers"]
+
+
+def on_starting(server):
+    server.log.info("Worker profile: %s", worker_profile.describe())
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from app.core.db import dispose_engines_after_fork
+
+        dispose_engines_after_fork()
@@ -0,0 +1,139 @@
+"""
+Batch job throughput on a synthetic 1M-row user table.
+
+Builds a scratch schema with copies of the `user` and
+`batch_job_checkpoint` tables (indexes included), fills it with --rows
+synthetic users, and runs a no-op UserBatchJob over it. It reports rows
+per second and per-chunk fetch latency at the start and the end of the
+table (keyset pagination keeps these flat), and checks resume: the first
+run is interrupted halfway and the second must pick up from the
+checkpoint without revisiting rows. The schema is dropped at the end
+unless --keep is given.
+
+    python scripts/bench_batch_job.py [--rows N] [--chunk-size N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.db import create_engine
+from app.jobs import base
+
+SCHEMA = "batch_job_bench"
+
+
+class Interrupted(Exception):
+    pass
+
+
+class NoopJob(base.UserBatchJob):
+    name = "bench_noop"
+
+    def __init__(self, *args, stop_after: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stop_after = stop_after
+        self.seen = 0
+        self.fetch_seconds: list[float] = []
+
+    async def _fetch_chunk(self, session, last_created_at, last_id):
+        if self.stop_after is not None and self.seen >= self.stop_after:
+            raise Interrupted()
+        started = time.perf_counter()
+        users = await super()._fetch_chunk(session, last_created_at, last_id)
+        self.fetch_seconds.append(time.perf_counter() - started)
+        return users
+
+    async def process_chunk(self, session, users):
+        self.seen += len(users)
+
+
+async def setup(rows: int) -> None:
+    admin_engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+    async with admin_engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.execute(text(f'CREATE TABLE {SCHEMA}."user" (LIKE public."user" INCLUDING ALL)'))
+        await conn.execute(text(
+            f"CREATE TABLE {SCHEMA}.batch_job_checkpoint (LIKE public.batch_job_checkpoint INCLUDING ALL)"
+        ))
+        started = time.perf_counter()
+        await conn.execute(text(
+            f'INSERT INTO {SCHEMA}."user" (id, email, status, created_at) '
+            "SELECT gen_random_uuid(), 'bench' || i || '@example.com', 'BASIC', "
+            "now() - make_interval(secs => :rows - i) FROM generate_series(1, :rows) AS i"
+        ), {"rows": rows})
+        await conn.execute(text(f'ANALYZE {SCHEMA}."user"'))
+    print(f"loaded {rows} rows in {time.perf_counter() - started:.1f} s")
+    await admin_engine.dispose()
+
+
+async def teardown() -> None:
+    admin_engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+    async with admin_engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await admin_engine.dispose()
+
+
+def report(label: str, job: NoopJob, elapsed: float) -> None:
+    fetches = [s * 1000 for s in job.fetch_seconds]
+    head, tail = fetches[:10], fetches[-10:]
+    print(
+        f"{label:<16} {job.seen:>9} rows {job.seen / elapsed:>10.0f} rows/s  "
+        f"fetch ms first/last chunks: {statistics.median(head):.2f} / {statistics.median(tail):.2f}"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=settings.BATCH_JOB_CHUNK_SIZE)
+    parser.add_argument("--target-db-load", type=float, default=1.0)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    await setup(args.rows)
+    # Point the job framework at the scratch schema
+    base.engine = create_async_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI),
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    options = {"chunk_size": args.chunk_size, "target_db_load": args.target_db_load}
+    ok = True
+    try:
+        job = NoopJob(**options)
+        started = time.perf_counter()
+        await job.run()
+        report("full pass", job, time.perf_counter() - started)
+
+        # Resume: stop a fresh pass halfway, then run it again
+        async with base.engine.begin() as conn:
+            await conn.execute(text("DELETE FROM batch_job_checkpoint"))
+        first = NoopJob(stop_after=args.rows // 2, **options)
+        try:
+            await first.run()
+        except Interrupted:
+            pass
+        second = NoopJob(**options)
+        started = time.perf_counter()
+        await second.run()
+        report("resumed pass", second, time.perf_counter() - started)
+        ok = first.seen + second.seen == args.rows
+        print(f"{'ok  ' if ok else 'FAIL'} resume: {first.seen} + {second.seen} rows of {args.rows}")
+        await base.engine.dispose()
+    finally:
+        if not args.keep:
+            await teardown()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,110 @@
+"""
+Bytes-on-wire vs CPU for the response compression settings.
+
+Compresses representative JSON bodies (user lists of increasing size, and
+the app's OpenAPI document when the app can be imported) at several gzip
+levels and brotli qualities, and prints the compressed size, ratio and CPU
+time per response. Use it to pick COMPRESSION_GZIP_LEVEL,
+COMPRESSION_BROTLI_QUALITY, COMPRESSION_MINIMUM_SIZE and
+COMPRESSION_OFFLOAD_SIZE.
+
+    python scripts/bench_compression.py [--repeat N]
+"""
+import argparse
+import gzip
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from app.models.user.model import UserPublic, UsersPublic
+except ImportError as exc:  # app dependencies missing, same fields by hand
+    print(f"building users without UserPublic: {exc}", file=sys.stderr)
+    UsersPublic = None
+
+GZIP_LEVELS = [1, 4, 6, 9]
+BROTLI_QUALITIES = [1, 4, 6, 11]
+
+
+def user_list(count: int) -> bytes:
+    """A UsersPublic body, as served by the user list endpoints."""
+    statuses = ["basic", "pro", "enterprise"]
+    users = [
+        {
+            "id": str(uuid.uuid4()),
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "phone_number": f"+1555{i:07d}",
+            "status": statuses[i % len(statuses)],
+        }
+        for i in range(count)
+    ]
+    if UsersPublic is None:
+        return json.dumps({"data": users, "count": count}).encode()
+    body = UsersPublic(data=[UserPublic(**user) for user in users], count=count)
+    return json.dumps(body.model_dump(mode="json")).encode()
+
+
+def openapi_document() -> bytes | None:
+    try:
+        from app.main import app
+    except Exception as exc:  # settings/env or dependencies missing
+        print(f"skipping OpenAPI document: {exc}", file=sys.stderr)
+        return None
+    return json.dumps(app.openapi()).encode()
+
+
+def measure(compress, body: bytes, repeat: int) -> tuple[int, float]:
+    out = compress(body)
+    started = time.process_time()
+    for _ in range(repeat):
+        compress(body)
+    cpu_ms = (time.process_time() - started) / repeat * 1000
+    return len(out), cpu_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "users x5": user_list(5),
+        "users x50": user_list(50),
+        "users x1000": user_list(1000),
+        "users x10000": user_list(10000),
+    }
+    openapi = openapi_document()
+    if openapi:
+        payloads["openapi.json"] = openapi
+
+    codecs = [(f"gzip-{level}", lambda b, l=level: gzip.compress(b, compresslevel=l, mtime=0)) for level in GZIP_LEVELS]
+    if brotli:
+        codecs += [(f"br-{quality}", lambda b, q=quality: brotli.compress(b, quality=q)) for quality in BROTLI_QUALITIES]
+    else:
+        print("brotli not installed, benchmarking gzip only", file=sys.stderr)
+
+    print(f"{'payload':<14} {'codec':<8} {'bytes in':>10} {'bytes out':>10} {'ratio':>7} {'cpu ms':>9} {'MB/s':>8}")
+    for name, body in payloads.items():
+        for codec, compress in codecs:
+            size, cpu_ms = measure(compress, body, args.repeat)
+            throughput = len(body) / 1e6 / (cpu_ms / 1000) if cpu_ms else float("inf")
+            print(
+                f"{name:<14} {codec:<8} {len(body):>10} {size:>10} "
+                f"{len(body) / size:>6.1f}x {cpu_ms:>9.3f} {throughput:>8.1f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
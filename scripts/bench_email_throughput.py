@@ -0,0 +1,72 @@
+"""
+Email send throughput against a local stub of the Logic App.
+
+Compares a new httpx.AsyncClient per email (the old send_email) with the
+shared pooled client behind email_service.send_email, and reports sends
+per second and TCP connections opened. The stub speaks plain HTTP, so the
+TLS handshakes the pooled client also saves in production are not counted.
+
+    python scripts/bench_email_throughput.py [--sends N] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from app.core.config import settings
+from app.services import email_service
+from stub_server import StubServer
+
+HTML = "<p>" + "x" * 4000 + "</p>"
+
+
+async def send_with_new_client(email_address: str) -> httpx.Response:
+    async with httpx.AsyncClient() as client:
+        return await client.post(
+            settings.EMAIL_LOGIC_APP_URL,
+            json={"Email": email_address, "HtmlTemplate": HTML, "Subject": "Benchmark"},
+        )
+
+
+async def send_with_shared_client(email_address: str) -> httpx.Response:
+    return await email_service.send_email(
+        email_address=email_address, html_template=HTML, subject="Benchmark"
+    )
+
+
+async def run(name: str, send, stub: StubServer, sends: int, concurrency: int) -> None:
+    stub.connections = 0
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with slots:
+            response = await send(f"user{i}@example.com")
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(sends)))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<22} {sends / elapsed:>10.0f} sends/s {stub.connections:>8} connections")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sends", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=settings.EMAIL_MAX_CONCURRENT_SENDS)
+    parser.add_argument("--latency", type=float, default=0.005, help="stub response delay")
+    args = parser.parse_args()
+
+    async with StubServer(delay=args.latency) as stub:
+        settings.EMAIL_LOGIC_APP_URL = stub.url
+        await run("client per send", send_with_new_client, stub, args.sends, args.concurrency)
+        await run("shared pooled client", send_with_shared_client, stub, args.sends, args.concurrency)
+        await email_service.close_email_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+Import-time and memory cost of loading the app, i.e. what every gunicorn
+worker pays on spawn (or the master, with preload_app).
+
+Imports the module in a fresh interpreter under `python -X importtime`,
+repeated a few times, and prints the median wall time, the child's peak
+RSS and the slowest imports made directly by the module (one level below
+it) by cumulative time, so a regression points at a subsystem. Pass --env
+to compare configurations, e.g. with the admin panel on:
+
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py --env ENABLE_ADMIN_PANEL=true
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_once(module: str, env: dict[str, str]) -> tuple[float, int, str]:
+    # Peak RSS is tracked per process, so measure each import in its own child
+    probe = (
+        "import resource, subprocess, sys;"
+        f"p = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {module}'],"
+        " stderr=subprocess.PIPE, text=True);"
+        "sys.stderr.write(p.stderr);"
+        "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss);"
+        "sys.exit(p.returncode)"
+    )
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.exit(f"importing {module} failed:\n{result.stderr[-2000:]}")
+    return elapsed, int(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def parse_importtime(output: str) -> list[tuple[int, int, str]]:
+    """(depth, cumulative microseconds, module) per import, in output order."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        # Nesting is shown by two spaces of indentation per level
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((depth, int(cumulative), name.strip()))
+    return rows
+
+
+def direct_imports(rows: list[tuple[int, int, str]], module: str) -> list[tuple[int, str]]:
+    """
+    (cumulative microseconds, module) for the imports made directly by
+    `module`, slowest first. Children are printed before their parent, so
+    they are the rows one level deeper right above it.
+    """
+    for index in range(len(rows) - 1, -1, -1):
+        depth, _, name = rows[index]
+        if name == module:
+            break
+    else:
+        return []
+
+    children = []
+    for child_depth, cumulative, name in reversed(rows[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((cumulative, name))
+    return sorted(children, reverse=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE")
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    for item in args.env:
+        key, _, value = item.partition("=")
+        env[key] = value
+
+    runs = [run_once(args.module, env) for _ in range(args.repeat)]
+    wall = statistics.median(elapsed for elapsed, _, _ in runs)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss_kib = max(rss for _, rss, _ in runs) // (1024 if sys.platform == "darwin" else 1)
+    rows = parse_importtime(runs[-1][2])
+    children = direct_imports(rows, args.module)
+
+    print(f"module:           {args.module}")
+    print(f"wall time:        {wall * 1000:.0f} ms (median of {args.repeat}, incl. interpreter start)")
+    print(f"import time:      {sum(us for depth, us, _ in rows if depth == 0) / 1000:.0f} ms (last run)")
+    print(f"peak RSS:         {rss_kib / 1024:.1f} MiB")
+    print()
+    # Modules already imported by a parent package show up under it instead
+    print(f"{'cumulative ms':>14}  imported directly by {args.module}")
+    for cumulative, name in children[: args.top]:
+        print(f"{cumulative / 1000:>14.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Per-request serialization cost of the user endpoints.
+
+Mounts the same handler twice on a bare FastAPI app: once returning the
+ORM object through response_model (FastAPI validation + the json module,
+the previous default), once through app.api.responses.model_response
+(pydantic-core straight from ORM attributes). Requests are driven
+directly through the ASGI interface, so routing costs the same on both
+sides and the difference is serialization.
+
+    python scripts/bench_serialization.py [--requests N]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.api.responses import model_response
+from app.models.user.model import User, UserPublic, UserStatus, UsersPublic
+
+
+def make_users(count: int) -> list[User]:
+    return [
+        User(
+            id=uuid.uuid4(),
+            email=f"user{i}@example.com",
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            phone_number="+15555550100",
+            status=UserStatus.PRO,
+            hashed_password="x" * 60,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(user: User, users: list[User]) -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/standard/user", response_model=UserPublic)
+    async def standard_user():
+        return user
+
+    @app.get("/standard/users", response_model=UsersPublic)
+    async def standard_users():
+        return UsersPublic(data=[UserPublic.model_validate(u) for u in users], count=len(users))
+
+    @app.get("/fast/user", response_model=UserPublic)
+    async def fast_user():
+        return model_response(UserPublic, user)
+
+    @app.get("/fast/users", response_model=UsersPublic)
+    async def fast_users():
+        return model_response(UsersPublic, {"data": users, "count": len(users)})
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def per_request_us(app: FastAPI, path: str, requests: int) -> float:
+    started = time.process_time()
+    for _ in range(requests):
+        await request(app, path)
+    return (time.process_time() - started) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--list-size", type=int, default=100)
+    args = parser.parse_args()
+
+    users = make_users(args.list_size)
+    app = build_app(users[0], users)
+
+    print(f"{'endpoint':<22} {'response_model us':>18} {'model_response us':>18} {'speedup':>8}")
+    for name, path in (("single user", "user"), (f"list of {args.list_size}", "users")):
+        assert await request(app, f"/standard/{path}")
+        standard = await per_request_us(app, f"/standard/{path}", args.requests)
+        fast = await per_request_us(app, f"/fast/{path}", args.requests)
+        print(f"{name:<22} {standard:>18.1f} {fast:>18.1f} {standard / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Per-request auth CPU with and without the access-token cache.
+
+Times what get_current_user spends turning the bearer token into a
+TokenPayload: a full jwt.decode + validation on every request versus
+security.decode_access_token, which only pays for it the first time a
+token is seen.
+
+    python scripts/bench_token_auth.py [--requests N] [--tokens N]
+"""
+import argparse
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.models.user.model import TokenPayload
+
+
+def uncached(token: str) -> TokenPayload:
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+    return TokenPayload(**payload)
+
+
+def run(decode, tokens: list[str], requests: int) -> float:
+    started = time.process_time()
+    for i in range(requests):
+        decode(tokens[i % len(tokens)])
+    return (time.process_time() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--tokens", type=int, default=100, help="distinct clients")
+    args = parser.parse_args()
+
+    tokens = [
+        security.create_access_token(f"user-{i}", timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+        for i in range(args.tokens)
+    ]
+
+    before = run(uncached, tokens, args.requests)
+    security._token_cache.clear()
+    after = run(security.decode_access_token, tokens, args.requests)
+
+    print(f"requests: {args.requests}, distinct tokens: {args.tokens}")
+    print(f"jwt.decode per request:   {before:8.2f} us CPU")
+    print(f"cached decode per request: {after:8.2f} us CPU ({before / after:.1f}x less)")
+    print(f"token cache: {security._token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
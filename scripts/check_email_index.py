@@ -0,0 +1,76 @@
+"""
+EXPLAIN check that every email lookup uses the lower(email) index.
+
+Runs each path that looks a user up by email (crud.get_user_by_email,
+which login, recovery, signup, the email-change checks and init_db go
+through; crud.authenticate; and the upsert in crud.get_or_create_user)
+with a mixed-case address inside a rolled-back transaction, captures the
+SQL it sends and EXPLAINs it. Sequential scans are disabled for the
+session, so a plan only avoids ix_user_email_lower when the query's
+expression cannot use it, regardless of table size.
+
+    python scripts/check_email_index.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import engine
+from app.models.user import crud
+from app.models.user.model import UserSSORegister
+
+INDEX = "ix_user_email_lower"
+EMAIL = "Index.Check@Example.COM"
+
+
+async def main() -> int:
+    captured: list[tuple[str, str, tuple]] = []
+    current = {"path": ""}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "email" in statement and not statement.startswith("EXPLAIN"):
+            captured.append((current["path"], statement, parameters))
+
+    paths = {
+        "crud.get_user_by_email": lambda s: crud.get_user_by_email(session=s, email=EMAIL),
+        "crud.authenticate": lambda s: crud.authenticate(session=s, email=EMAIL, password="x" * 8),
+        "crud.get_or_create_user": lambda s: crud.get_or_create_user(
+            session=s, user_register=UserSSORegister(email=EMAIL)
+        ),
+    }
+
+    failures = 0
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            for name, run in paths.items():
+                current["path"] = name
+                await run(session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        for name, statement, parameters in captured:
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plan = "\n".join(row[0] for row in result)
+            ok = INDEX in plan
+            failures += not ok
+            first_line = statement.split("\n", 1)[0][:60]
+            print(f"{'ok  ' if ok else 'FAIL'} {name}: {first_line}...")
+            if not ok:
+                print(plan)
+        await transaction.rollback()
+
+    await engine.dispose()
+    return 1 if failures or not captured else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,112 @@
+"""
+Fault-injection check for the outbound-call layer (app.core.outbound).
+
+Runs two local stub servers, one standing in for the email Logic App and
+one for an identity provider, and drives both through get_dependency()
+with shortened deadlines. While the email stub hangs or returns 503s the
+check asserts that:
+
+- email calls give up at their deadline, and once the breaker opens they
+  fail fast without touching the stub;
+- calls to the healthy provider keep their normal latency throughout;
+- cancelling in-flight calls (client disconnects) neither opens the
+  circuit nor wedges a half-open trial;
+- after the reset timeout a single trial call closes the circuit again.
+
+    python scripts/check_outbound_isolation.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.outbound import get_dependency
+from stub_server import StubServer
+
+DEADLINE = 0.2
+RESET_TIMEOUT = 0.5
+results: list[bool] = []
+
+
+def check(name: str, ok: bool, detail: str = "") -> None:
+    results.append(ok)
+    print(f"{'ok  ' if ok else 'FAIL'} {name}{': ' + detail if detail else ''}")
+
+
+async def timed_call(dependency, client: httpx.AsyncClient, url: str) -> tuple[str, float]:
+    started = time.perf_counter()
+    try:
+        response = await dependency.call(
+            client.get, url, is_failure=lambda response: response.status_code >= 500
+        )
+        outcome = str(response.status_code)
+    except CircuitOpenError:
+        outcome = "open"
+    except TimeoutError:
+        outcome = "timeout"
+    return outcome, time.perf_counter() - started
+
+
+async def main() -> int:
+    email, idp = get_dependency("email"), get_dependency("sso:stub")
+    for dependency in (email, idp):
+        dependency.deadline = DEADLINE
+        dependency.breaker.reset_timeout = RESET_TIMEOUT
+    threshold = email.breaker.failure_threshold
+
+    async with StubServer(hang=True) as email_stub, StubServer(delay=0.01) as idp_stub, \
+            httpx.AsyncClient() as client:
+        # 1. Hanging dependency: deadline, then fail fast
+        outcomes = [await timed_call(email, client, email_stub.url) for _ in range(threshold + 3)]
+        timeouts = [seconds for outcome, seconds in outcomes if outcome == "timeout"]
+        fast = [seconds for outcome, seconds in outcomes if outcome == "open"]
+        check("hung calls stop at the deadline", len(timeouts) == threshold
+              and max(timeouts) < DEADLINE * 2, f"{len(timeouts)} timeouts, max {max(timeouts):.3f}s")
+        check("open circuit fails fast", len(fast) == 3 and max(fast) < 0.01,
+              f"{len(fast)} rejected, max {max(fast) * 1000:.2f}ms")
+        check("breaker state exported", email.stats()["state"] == CircuitBreaker.OPEN, str(email.stats()))
+
+        # 2. The healthy dependency is unaffected while email is down
+        idp_calls = await asyncio.gather(*(timed_call(idp, client, idp_stub.url) for _ in range(20)))
+        check("healthy dependency isolated", all(outcome == "202" for outcome, _ in idp_calls)
+              and max(seconds for _, seconds in idp_calls) < DEADLINE,
+              f"max {max(seconds for _, seconds in idp_calls) * 1000:.1f}ms")
+
+        # 3. Cancellation is not a failure and frees the half-open trial
+        await asyncio.sleep(RESET_TIMEOUT)
+        trial = asyncio.create_task(email.call(client.get, email_stub.url))
+        await asyncio.sleep(DEADLINE / 4)
+        trial.cancel()
+        await asyncio.gather(trial, return_exceptions=True)
+        check("cancelled trial releases the slot", email.breaker.is_available, str(email.stats()))
+
+        idp.breaker.record_success()
+        calls = [asyncio.create_task(idp.call(client.get, idp_stub.url)) for _ in range(threshold * 2)]
+        await asyncio.sleep(0)
+        for task in calls:
+            task.cancel()
+        await asyncio.gather(*calls, return_exceptions=True)
+        check("cancellations don't open the circuit", idp.stats()["state"] == CircuitBreaker.CLOSED,
+              str(idp.stats()))
+
+        # 4. 503s count as failures; recovery closes the circuit again
+        email_stub.hang, email_stub.fail_rate = False, 1.0
+        outcome, _ = await timed_call(email, client, email_stub.url)
+        check("503 on the trial re-opens", outcome == "503" and email.stats()["state"] == CircuitBreaker.OPEN,
+              str(email.stats()))
+        email_stub.fail_rate = 0.0
+        await asyncio.sleep(RESET_TIMEOUT)
+        outcome, _ = await timed_call(email, client, email_stub.url)
+        check("successful trial closes", outcome == "202" and email.stats()["state"] == CircuitBreaker.CLOSED,
+              str(email.stats()))
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,121 @@
+"""
+Query-count checks for the user write paths.
+
+Counts the SQL statements and commits that reach the primary engine for
+each write path and fails if any path regresses: a signup must be one
+INSERT ... RETURNING and one commit, a PATCH /users/me one SELECT (the
+uncached current user) plus one UPDATE ... RETURNING and one commit, with
+no refresh SELECTs. Changing the email adds exactly one SELECT, for the
+uniqueness check. Uses the app's database settings and removes the user
+it creates.
+
+    python scripts/check_query_counts.py
+"""
+import asyncio
+import sys
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from sqlalchemy import delete, event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import security
+from app.core.config import settings
+from app.core.db import engine
+from app.main import app
+from app.models.user import crud
+from app.models.user.cache import user_cache
+from app.models.user.model import User, UserRegister, UserUpdate
+
+
+@contextmanager
+def count_queries():
+    counts = {"statements": [], "commits": 0}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        counts["statements"].append(statement.split(None, 1)[0].upper())
+
+    def on_commit(conn):
+        counts["commits"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    event.listen(engine.sync_engine, "commit", on_commit)
+    try:
+        yield counts
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+        event.remove(engine.sync_engine, "commit", on_commit)
+
+
+def check(name: str, counts: dict, statements: list[str], commits: int) -> bool:
+    ok = counts["statements"] == statements and counts["commits"] == commits
+    print(
+        f"{'ok  ' if ok else 'FAIL'} {name}: {counts['statements']} / {counts['commits']} commit(s)"
+        + ("" if ok else f", expected {statements} / {commits} commit(s)")
+    )
+    return ok
+
+
+async def main() -> int:
+    email = f"query-count-{uuid.uuid4().hex[:8]}@example.com"
+    results = []
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        with count_queries() as counts:
+            user = await crud.register_user(
+                session=session,
+                user_register=UserRegister(email=email, password="query-count-pw", first_name="Q"),
+            )
+        results.append(check("crud.register_user", counts, ["INSERT"], 1))
+        ok = user.updated_at is not None
+        print(f"{'ok  ' if ok else 'FAIL'} register_user sets updated_at: {user.updated_at}")
+        results.append(ok)
+
+        with count_queries() as counts:
+            await crud.update_user(session=session, db_user=user, user_in=UserUpdate(email=email, last_name="Count"))
+        # No refresh: the UPDATE's RETURNING repopulates the object
+        results.append(check("crud.update_user", counts, ["UPDATE"], 1))
+
+    token = security.create_access_token(user.id, timedelta(minutes=5))
+    user_cache.clear()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with count_queries() as counts:
+            response = await client.patch(
+                f"{settings.API_PREFIX}/users/me",
+                # UserUpdate requires the email; unchanged, it skips the uniqueness SELECT
+                json={"email": email, "first_name": "Query"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        ok = response.status_code == 200
+        print(f"{'ok  ' if ok else 'FAIL'} PATCH /users/me status: {response.status_code}")
+        results.append(ok)
+        # SELECT current user, UPDATE ... RETURNING
+        results.append(check("PATCH /users/me", counts, ["SELECT", "UPDATE"], 1))
+
+        with count_queries() as counts:
+            response = await client.patch(
+                f"{settings.API_PREFIX}/users/me",
+                json={"email": f"renamed-{email}", "first_name": "Query"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        ok = response.status_code == 200
+        print(f"{'ok  ' if ok else 'FAIL'} PATCH /users/me (new email) status: {response.status_code}")
+        results.append(ok)
+        # SELECT current user, SELECT email uniqueness, UPDATE ... RETURNING
+        results.append(check("PATCH /users/me (new email)", counts, ["SELECT", "SELECT", "UPDATE"], 1))
+
+    async with AsyncSession(engine) as session:
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
+    await engine.dispose()
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,77 @@
+"""
+Login flood: CPU and work done per request while the limiter is engaged.
+
+Drives /login/access-token in-process (httpx ASGI transport, so every
+request comes from the same client IP) with wrong passwords for rotating
+and repeated emails, and reports per phase how many requests reached
+crud.authenticate (a DB lookup plus a bcrypt verify) and the CPU spent per
+request. Once the per-IP limit trips, authenticate calls should stop and
+CPU per request should stay flat at the cost of a 429.
+
+Needs the app's database settings, like the app itself.
+
+    python scripts/load_test_login.py [--requests N] [--concurrency N]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from app.api.routes.login import login
+from app.core.config import settings
+from app.main import app
+
+authenticate_calls = 0
+_authenticate = login.crud.authenticate
+
+
+async def counting_authenticate(**kwargs):
+    global authenticate_calls
+    authenticate_calls += 1
+    return await _authenticate(**kwargs)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--phases", type=int, default=5)
+    args = parser.parse_args()
+
+    login.crud.authenticate = counting_authenticate
+    url = f"{settings.API_PREFIX}/login/access-token"
+    transport = httpx.ASGITransport(app=app)
+    per_phase = args.requests // args.phases
+
+    print(f"{'phase':>5} {'requests':>9} {'authenticate':>13} {'cpu us/req':>11}  statuses")
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def attempt(i: int) -> int:
+            async with semaphore:
+                response = await client.post(
+                    url, data={"username": f"victim{i % 10}@example.com", "password": "wrong"}
+                )
+                return response.status_code
+
+        for phase in range(args.phases):
+            calls_before = authenticate_calls
+            started = time.process_time()
+            statuses = await asyncio.gather(
+                *(attempt(phase * per_phase + i) for i in range(per_phase))
+            )
+            cpu_us = (time.process_time() - started) / per_phase * 1e6
+            print(
+                f"{phase + 1:>5} {per_phase:>9} {authenticate_calls - calls_before:>13} "
+                f"{cpu_us:>11.1f}  {dict(Counter(statuses))}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
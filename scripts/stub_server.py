@@ -0,0 +1,67 @@
+"""
+Minimal local HTTP/1.1 server with keep-alive and injectable faults, used
+by the outbound-call benchmarks and checks in this directory as a stand-in
+for the email Logic App and identity providers.
+"""
+import asyncio
+import random
+
+
+class StubServer:
+    """
+    Answers every request with `status` after `delay` seconds. With
+    `fail_rate` a share of requests get a 503 instead, and with `hang` the
+    server reads requests but never answers. All attributes can be changed
+    while it runs. Counts connections and requests served.
+    """
+
+    def __init__(self, status: int = 202, delay: float = 0.0, fail_rate: float = 0.0, hang: bool = False):
+        self.status = status
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.hang = hang
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.base_events.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "StubServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=1024)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+
+                if self.hang:
+                    await asyncio.Event().wait()
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                status = 503 if random.random() < self.fail_rate else self.status
+                body = b'{"ok": true}'
+                writer.write(
+                    b"HTTP/1.1 %d STUB\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\nConnection: keep-alive\r\n\r\n%s" % (status, len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()